@@ -11,7 +11,7 @@ from core import database as core_database
 from core.models import User, Place
 from User.user_router import get_current_user
 from DataCollector.collector_service import get_collector_service
-from DataCollector.tour_api_service import get_tour_api_service, generate_tags_from_place
+from DataCollector.tour_api_service import get_tour_api_service, generate_tags_from_place, clean_html_cached
 
 logger = logging.getLogger(__name__)
 
@@ -405,6 +405,18 @@ async def get_index_stats():
     }
 
 
+@router.get("/debug/clean-html-cache")
+async def get_clean_html_cache_info():
+    """TourAPI HTML 정리 결과 LRU 캐시 현황 조회"""
+    info = clean_html_cached.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "maxsize": info.maxsize,
+        "currsize": info.currsize
+    }
+
+
 @router.get("/places")
 async def list_places(
     region: Optional[str] = None,
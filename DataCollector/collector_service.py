@@ -1,12 +1,13 @@
 import asyncio
 import httpx
-from typing import List, Optional, Dict, Any
+from dataclasses import asdict
+from typing import List, Optional, Dict, Any, Tuple, Union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, update
 
 from core import config
 from core.models import Place
-from DataCollector.tour_api_service import TourAPIService, get_tour_api_service
+from DataCollector.tour_api_service import TourAPIService, PlaceRow, get_tour_api_service
 from DataCollector.wikipedia_service import WikipediaService, get_wikipedia_service
 
 
@@ -86,14 +87,12 @@ class DataCollectorService:
                     if not items:
                         break
 
-                    for item in items:
-                        if type_collected >= max_items_per_type:
-                            break
-
-                        result = await self._process_and_save_place(
-                            db, item, enhance_with_wiki
-                        )
+                    results = await self._process_and_save_page(
+                        db, items, enhance_with_wiki,
+                        max_items_per_type - type_collected
+                    )
 
+                    for item, result in zip(items, results):
                         if result == "created":
                             type_collected += 1
                             total_collected += 1
@@ -124,17 +123,73 @@ class DataCollectorService:
             "error_details": errors[:10] if errors else []
         }
 
-    async def _process_and_save_place(
+    async def _process_and_save_page(
+        self,
+        db: AsyncSession,
+        items: List[Dict[str, Any]],
+        enhance_with_wiki: bool,
+        limit: int
+    ) -> List[str]:
+        """
+        검색 결과 한 페이지 처리 및 저장
+
+        Wikipedia 보강은 페이지에서 설명이 짧은 장소를 모아 한 번에 병렬 조회
+
+        Args:
+            limit: 새로 저장할 최대 개수 (도달하면 나머지 item은 처리하지 않음)
+
+        Returns:
+            처리한 item 순서대로 "created", "exists", "error"
+        """
+        results: List[str] = []
+        prepared: List[Tuple[int, PlaceRow]] = []
+        seen = set()
+
+        for item in items:
+            if len(prepared) >= limit:
+                break
+
+            outcome = await self._prepare_place(db, item)
+            if isinstance(outcome, str):
+                results.append(outcome)
+            elif (outcome.name, outcome.latitude, outcome.longitude) in seen:
+                # 저장을 페이지 끝으로 미루므로 같은 페이지 안의 중복은 여기서 걸러냄
+                results.append("exists")
+            else:
+                seen.add((outcome.name, outcome.latitude, outcome.longitude))
+                prepared.append((len(results), outcome))
+                results.append("error")  # 저장 결과로 갱신
+
+        # Wikipedia로 설명 보강 (페이지 단위 일괄)
+        if enhance_with_wiki:
+            targets = [
+                place_data for _, place_data in prepared
+                if not place_data.description or len(place_data.description) < 50
+            ]
+            if targets:
+                wiki_descs = await self.wiki_service.enhance_descriptions(
+                    [place_data.name for place_data in targets],
+                    [place_data.description for place_data in targets]
+                )
+                for place_data, wiki_desc in zip(targets, wiki_descs):
+                    if wiki_desc:
+                        place_data.description = wiki_desc
+
+        for idx, place_data in prepared:
+            results[idx] = await self._save_place(db, place_data)
+
+        return results
+
+    async def _prepare_place(
         self,
         db: AsyncSession,
-        item: Dict[str, Any],
-        enhance_with_wiki: bool
-    ) -> str:
+        item: Dict[str, Any]
+    ) -> Union[PlaceRow, str]:
         """
-        개별 장소 처리 및 저장
+        개별 장소 중복 확인 및 상세 정보 파싱 (Wikipedia 보강·저장 전 단계)
 
         Returns:
-            "created", "exists", "error"
+            저장할 PlaceRow 또는 "exists", "error"
         """
         try:
             content_id = int(item.get("contentid", 0))
@@ -166,54 +221,32 @@ class DataCollectorService:
             # 데이터 파싱
             place_data = self.tour_api.parse_place_data(item, detail)
 
+            # 유효한 좌표 확인 (Wikipedia·이미지 추가 조회 전에 걸러냄)
+            if place_data.latitude == 0 or place_data.longitude == 0:
+                return "error"
+
             # Tour API image_url이 없으면 detailImage2에서 추가 이미지 조회
-            if not place_data.get("image_url") and content_id:
+            if not place_data.image_url and content_id:
                 extra_image = await self._fetch_additional_image(content_id)
                 if extra_image:
-                    place_data["image_url"] = extra_image
-
-            # Wikipedia로 설명 보강
-            if enhance_with_wiki and (
-                not place_data.get("description") or
-                len(place_data.get("description", "")) < 50
-            ):
-                wiki_desc = await self.wiki_service.enhance_description(
-                    name,
-                    place_data.get("description")
-                )
-                if wiki_desc:
-                    place_data["description"] = wiki_desc
+                    place_data.image_url = extra_image
 
-            # 유효한 좌표 확인
-            if place_data["latitude"] == 0 or place_data["longitude"] == 0:
-                return "error"
+            return place_data
 
-            # DB 저장
-            place = Place(
-                name=place_data["name"],
-                category=place_data.get("category"),
-                address=place_data.get("address"),
-                latitude=place_data["latitude"],
-                longitude=place_data["longitude"],
-                description=place_data.get("description"),
-                tags=place_data.get("tags"),
-                image_url=place_data.get("image_url"),
-                operating_hours=place_data.get("operating_hours"),
-                closed_days=place_data.get("closed_days"),
-                fee_info=place_data.get("fee_info"),
-                content_id=place_data.get("content_id"),
-                content_type_id=place_data.get("content_type_id"),
-                cat1=place_data.get("cat1"),
-                cat2=place_data.get("cat2"),
-                cat3=place_data.get("cat3"),
-                readcount=place_data.get("readcount"),
-                tel=place_data.get("tel"),
-                homepage=place_data.get("homepage"),
-            )
+        except Exception as e:
+            await db.rollback()
+            return "error"
 
-            db.add(place)
-            await db.commit()
+    async def _save_place(self, db: AsyncSession, place_data: PlaceRow) -> str:
+        """
+        파싱된 장소 저장
 
+        Returns:
+            "created", "error"
+        """
+        try:
+            db.add(Place(**asdict(place_data)))
+            await db.commit()
             return "created"
 
         except Exception as e:
@@ -263,14 +296,11 @@ class DataCollectorService:
                 if not items:
                     break
 
-                for item in items:
-                    if collected >= max_items:
-                        break
-
-                    result = await self._process_and_save_place(
-                        db, item, enhance_with_wiki
-                    )
+                results = await self._process_and_save_page(
+                    db, items, enhance_with_wiki, max_items - collected
+                )
 
+                for result in results:
                     if result == "created":
                         collected += 1
                     elif result == "exists":
@@ -1,15 +1,102 @@
+import logging
+import re
+import time
 import httpx
+import socket
 import asyncio
-from typing import List, Optional, Dict, Any
+import orjson
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Awaitable, Callable
 
 from core.config import get_config
 
+logger = logging.getLogger(__name__)
+
 
 class TourAPIRateLimitError(Exception):
     """TourAPI 요청 제한 에러"""
     pass
 
 
+class TokenBucket:
+    """
+    토큰 버킷 요청 속도 제한기
+
+    초당 rate개씩 토큰이 충전되고 최대 capacity개까지 버스트를 허용한다.
+    토큰이 없으면 다음 토큰이 찰 때까지 대기하며, 대기자는 도착 순서대로 처리된다.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+# 태그용 지역명 (주소 한 번 스캔으로 탐지)
+_TAG_REGION_RE = re.compile("|".join([
+    "서울", "부산", "제주", "강원", "경주", "전주", "여수",
+    "인천", "대구", "광주", "대전", "울산", "세종",
+    "속초", "강릉", "춘천", "수원", "통영", "목포",
+]))
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=8192)
+def clean_html_cached(text: str) -> str:
+    """HTML 태그/엔티티/연속 공백 정리 (같은 원문은 캐시 재사용)"""
+    # HTML 태그 제거
+    text = _HTML_TAG_RE.sub('', text)
+    # HTML 엔티티 변환
+    text = text.replace("&nbsp;", " ")
+    text = text.replace("&amp;", "&")
+    text = text.replace("&lt;", "<")
+    text = text.replace("&gt;", ">")
+    text = text.replace("&quot;", '"')
+    # 연속 공백 제거
+    text = _WHITESPACE_RE.sub(' ', text)
+    return text.strip()
+
+
+@dataclass(slots=True)
+class PlaceRow:
+    """parse_place_data 결과 (Place 모델 컬럼과 동일한 필드명)"""
+    name: str
+    category: str
+    address: str
+    latitude: float
+    longitude: float
+    image_url: Optional[str]
+    content_id: int
+    content_type_id: int
+    cat1: Optional[str] = None
+    cat2: Optional[str] = None
+    cat3: Optional[str] = None
+    readcount: Optional[int] = None
+    description: Optional[str] = None
+    tel: Optional[str] = None
+    homepage: Optional[str] = None
+    operating_hours: Optional[str] = None
+    closed_days: Optional[str] = None
+    fee_info: Optional[str] = None
+    tags: Optional[List[str]] = None
+
+
 class TourAPIService:
     """
     한국관광공사 TourAPI 서비스 (v2)
@@ -68,18 +155,71 @@ class TourAPIService:
         # 간단한 in-memory TTL 캐시 for detail lookups
         self._detail_cache: dict = {}
         self._cache_lock = asyncio.Lock()
-        # 캐시 TTL 초 (기본 6시간)
+        # 캐시 TTL 초 (기본 6시간), 최대 항목 수 (초과 시 오래된 항목부터 제거)
         self._detail_cache_ttl = 60 * 60 * 6
+        self._detail_cache_maxsize = 4096
+        # 진행 중인 조회 (같은 캐시 키의 동시 요청은 한 번만 호출)
+        self._inflight: Dict[str, asyncio.Future] = {}
         # 재사용 가능한 Async HTTP 클라이언트 생성 (커넥션 풀 재활용)
-        # limits는 필요 시 환경에 맞게 조정
-        self._client = httpx.AsyncClient(timeout=30.0)
+        # HTTP/2 멀티플렉싱 + gzip/brotli 압축으로 응답 바이트 절감
+        # (서버가 H2를 지원하지 않으면 ALPN 협상으로 HTTP/1.1 keep-alive 사용)
+        # 작은 JSON 응답이 많으므로 TCP_NODELAY로 Nagle 지연 제거, keep-alive 유지
+        # 풀 크기는 transport에 지정 (transport를 넘기면 AsyncClient의 limits는 무시됨)
+        transport = httpx.AsyncHTTPTransport(
+            retries=1,
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            socket_options=[
+                (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ],
+        )
+        self._client = httpx.AsyncClient(
+            # 응답은 느릴 수 있지만 연결 수립이 막히면 빨리 실패
+            timeout=httpx.Timeout(30.0, connect=3.0),
+            transport=transport,
+            headers={"Accept-Encoding": "gzip, br"},
+        )
+
+        # 실제 HTTP 요청 속도 제한 (캐시 적중은 토큰 소모 없음, 설정값 기본 초당 30건 + 버스트 100건)
+        self._rate_limiter = TokenBucket(
+            rate=config.tour_api_rate_per_sec,
+            capacity=config.tour_api_burst
+        )
 
         # 검색 결과 캐시 (간단한 요청 레벨 캐시, 기본 5분)
         self._search_cache: dict = {}
         self._search_cache_ttl = 60 * 5
+        self._search_cache_maxsize = 512
+
+        # 대표 이미지 캐시 (content_id → URL 또는 None, 기본 24시간)
+        # 이미지가 없는 장소도 캐시해 update_missing_images 반복 호출 시 재조회 방지
+        self._image_cache: dict = {}
+        self._image_cache_ttl = 60 * 60 * 24
+        self._image_cache_maxsize = 4096
+
+    async def _single_flight(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """같은 key로 진행 중인 조회가 있으면 그 결과를 공유, 없으면 factory로 새로 조회"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # 한 호출자가 취소되어도 다른 대기자의 조회는 계속 진행
+        return await asyncio.shield(future)
+
+    @staticmethod
+    def _store_cache(cache: dict, key: str, value: Any, maxsize: int) -> None:
+        """(저장 시각, 값) 형태로 캐시에 저장, maxsize 초과 시 오래된 항목부터 제거"""
+        cache[key] = (time.time(), value)
+        while len(cache) > maxsize:
+            # dict는 삽입 순서를 유지하므로 첫 항목이 가장 오래된 항목
+            cache.pop(next(iter(cache)))
 
     async def _get_with_fallback(self, endpoint: str, params: dict, _retry: int = 0):
         """기본 요청 수행. 404→KorService 재시도, 429→지수 백오프 재시도."""
+        await self._rate_limiter.acquire()
         try:
             response = await self._client.get(endpoint, params=params)
         except Exception:
@@ -88,16 +228,18 @@ class TourAPIService:
         # 429 Too Many Requests → 지수 백오프 후 재시도 (최대 5회)
         if response.status_code == 429:
             if _retry >= 5:
-                response.raise_for_status()
+                # 호출부(/detail 등)에서 503으로 구분할 수 있도록 전용 예외로 변환
+                raise TourAPIRateLimitError(f"TourAPI 요청 제한 (재시도 5회 초과): {endpoint}")
             wait_sec = int(response.headers.get("Retry-After", 0)) or (2 ** _retry * 5)
-            print(f"WARN TourAPI: 429 rate limit, waiting {wait_sec}s (retry {_retry+1}/5)")
+            logger.warning("TourAPI 429 rate limit, waiting %ss (retry %s/5)", wait_sec, _retry + 1)
             await asyncio.sleep(wait_sec)
             return await self._get_with_fallback(endpoint, params, _retry + 1)
 
         # 404인 경우 'KorService2' 대신 'KorService'로 재시도
         if response.status_code == 404 and 'KorService2' in endpoint:
             alt = endpoint.replace('KorService2', 'KorService')
-            print(f"WARN TourAPI: endpoint returned 404, retrying with {alt}")
+            logger.warning("TourAPI endpoint returned 404, retrying with %s", alt)
+            await self._rate_limiter.acquire()
             try:
                 response = await self._client.get(alt, params=params)
             except Exception:
@@ -161,11 +303,11 @@ class TourAPIService:
             data = response.json()
         finally:
             t1 = asyncio.get_event_loop().time()
-            print(f"DEBUG TourAPI.search_places: elapsed={(t1-t0):.3f}s endpoint={endpoint}")
+            logger.debug("TourAPI.search_places: elapsed=%.3fs endpoint=%s", t1 - t0, endpoint)
 
         # 수정
         if not isinstance(data, dict):
-            print(f"DEBUG tour_api search_places: unexpected data type={type(data)}, value={str(data)[:200]}")
+            logger.warning("TourAPI.search_places: unexpected data type=%s, value=%.200s", type(data), data)
             return []
 
         items_container = data.get("response", {}).get("body", {}).get("items") or {}
@@ -221,21 +363,18 @@ class TourAPIService:
         if event_end_date:
             params["eventEndDate"] = event_end_date
 
-        print(f"DEBUG TourAPI: 요청 URL = {endpoint}")
-        print(f"DEBUG TourAPI: 파라미터 = {params}")
+        logger.debug("TourAPI 요청 URL = %s, 파라미터 = %s", endpoint, params)
 
         # 캐시 키 생성
-        import json
-        cache_key = f"searchFestival:{endpoint}:{json.dumps(params, sort_keys=True, ensure_ascii=False)}"
+        cache_key = f"searchFestival:{endpoint}:{orjson.dumps(params, option=orjson.OPT_SORT_KEYS).decode()}"
 
         # 캐시 확인
         async with self._cache_lock:
             cached = self._search_cache.get(cache_key)
             if cached:
                 ts, value = cached
-                import time
                 if time.time() - ts < self._search_cache_ttl:
-                    print("DEBUG TourAPI.search_festivals: cache hit", cache_key)
+                    logger.debug("TourAPI.search_festivals: cache hit %s", cache_key)
                     return value
                 else:
                     try:
@@ -243,46 +382,53 @@ class TourAPIService:
                     except KeyError:
                         pass
 
+        # 같은 페이지의 동시 요청은 하나의 조회 결과를 공유
+        return await self._single_flight(
+            cache_key,
+            lambda: self._fetch_festival_page(endpoint, params, cache_key)
+        )
+
+    async def _fetch_festival_page(
+        self,
+        endpoint: str,
+        params: dict,
+        cache_key: str
+    ) -> List[Dict[str, Any]]:
+        """searchFestival2 한 페이지 조회 후 캐시에 저장"""
         t0 = asyncio.get_event_loop().time()
         try:
             response = await self._get_with_fallback(endpoint, params)
-            print(f"DEBUG TourAPI: 응답 상태 = {response.status_code}")
+            logger.debug("TourAPI 응답 상태 = %s", response.status_code)
             response.raise_for_status()
             data = response.json()
-            print("DEBUG TourAPI: 전체 응답 =", data)
+            logger.debug("TourAPI 전체 응답 = %s", data)
 
             header = data.get("response", {}).get("header", {})
             result_code = header.get("resultCode") or data.get("resultCode")
             result_msg = header.get("resultMsg") or data.get("resultMsg")
-            print(f"DEBUG TourAPI: 결과 코드 = {result_code}, 메시지 = {result_msg}")
+            logger.debug("TourAPI 결과 코드 = %s, 메시지 = %s", result_code, result_msg)
 
             if result_code and str(result_code) not in ("00", "0000", "0"):
-                print(f"ERROR TourAPI: API error {result_code} - {result_msg}")
+                logger.error("TourAPI API error %s - %s", result_code, result_msg)
                 return []
 
             items = data.get("response", {}).get("body", {}).get("items", {}).get("item", [])
             if isinstance(items, dict):
                 items = [items]
 
-            print(f"DEBUG TourAPI: 파싱된 아이템 수 = {len(items) if items else 0}")
+            logger.debug("TourAPI 파싱된 아이템 수 = %s", len(items) if items else 0)
 
             # 결과를 캐시에 저장
             async with self._cache_lock:
-                import time
-                try:
-                    self._search_cache[cache_key] = (time.time(), items or [])
-                except Exception:
-                    pass
+                self._store_cache(self._search_cache, cache_key, items or [], self._search_cache_maxsize)
 
             return items or []
-        except Exception as e:
-            print(f"ERROR TourAPI: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("TourAPI 축제 검색 실패")
             return []
         finally:
             t1 = asyncio.get_event_loop().time()
-            print(f"DEBUG TourAPI.search_festivals: elapsed={(t1-t0):.3f}s")
+            logger.debug("TourAPI.search_festivals: elapsed=%.3fs", t1 - t0)
 
     async def get_detail_common(self, content_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -314,7 +460,7 @@ class TourAPIService:
             data = response.json()
         finally:
             t1 = asyncio.get_event_loop().time()
-            print(f"DEBUG TourAPI.get_detail_common: elapsed={(t1-t0):.3f}s contentId={content_id}")
+            logger.debug("TourAPI.get_detail_common: elapsed=%.3fs contentId=%s", t1 - t0, content_id)
 
         # TourAPI는 결과 없을 때 items를 빈 문자열("")로 반환하는 경우가 있어
         # items 컨테이너를 먼저 안전하게 추출하고 타입을 검사한다.
@@ -371,7 +517,7 @@ class TourAPIService:
             data = response.json()
         finally:
             t1 = asyncio.get_event_loop().time()
-            print(f"DEBUG TourAPI.get_detail_intro: elapsed={(t1-t0):.3f}s contentId={content_id}")
+            logger.debug("TourAPI.get_detail_intro: elapsed=%.3fs contentId=%s", t1 - t0, content_id)
 
         # 안전한 items 처리: 빈 문자열 또는 비정상 구조에 대비
         items_container = data.get("response", {}).get("body", {}).get("items") or {}
@@ -415,7 +561,7 @@ class TourAPIService:
             data = response.json()
         finally:
             t1 = asyncio.get_event_loop().time()
-            print(f"DEBUG TourAPI.get_detail_image: elapsed={(t1-t0):.3f}s contentId={content_id}")
+            logger.debug("TourAPI.get_detail_image: elapsed=%.3fs contentId=%s", t1 - t0, content_id)
 
         # 안전한 items 처리
         items_container = data.get("response", {}).get("body", {}).get("items") or {}
@@ -437,12 +583,18 @@ class TourAPIService:
         Returns:
             대표 이미지 URL 또는 None
         """
+        cached = self._image_cache.get(content_id)
+        if cached and time.time() - cached[0] < self._image_cache_ttl:
+            return cached[1]
+
         images = await self.get_detail_image(content_id)
-        if not images:
-            return None
+        image_url = None
+        if images:
+            first = images[0]
+            image_url = first.get("originimgurl") or first.get("smallimageurl")
 
-        first = images[0]
-        return first.get("originimgurl") or first.get("smallimageurl")
+        self._store_cache(self._image_cache, content_id, image_url, self._image_cache_maxsize)
+        return image_url
 
     async def get_full_place_info(
         self,
@@ -461,7 +613,6 @@ class TourAPIService:
             if cached:
                 ts, value = cached
                 # 만료 검사
-                import time
                 if time.time() - ts < self._detail_cache_ttl:
                     return value
                 else:
@@ -471,13 +622,34 @@ class TourAPIService:
                     except KeyError:
                         pass
 
-        # 2) 실제 요청 (병렬로 공통/소개 요청 수행)
+        # 2) 실제 요청 (동일 키의 동시 요청은 진행 중인 조회 결과를 공유)
+        return await self._single_flight(
+            cache_key,
+            lambda: self._fetch_full_place_info(content_id, content_type_id, cache_key)
+        )
+
+    async def _fetch_full_place_info(
+        self,
+        content_id: int,
+        content_type_id: int,
+        cache_key: str
+    ) -> Dict[str, Any]:
+        """공통/소개 정보를 병렬 조회 후 캐시에 저장"""
         common, intro = await asyncio.gather(
             self.get_detail_common(content_id),
             self.get_detail_intro(content_id, content_type_id),
             return_exceptions=True
         )
 
+        # 요청 제한은 호출부(/detail 등)에서 503으로 처리하도록 그대로 전파
+        for outcome in (common, intro):
+            if isinstance(outcome, TourAPIRateLimitError):
+                raise outcome
+
+        # 둘 다 실패하면 "정보 없음"이 아니라 실제 오류이므로 전파 (한쪽만 실패하면 있는 정보로 진행)
+        if isinstance(common, Exception) and isinstance(intro, Exception):
+            raise common
+
         result = {}
         if isinstance(common, dict):
             result.update(common)
@@ -485,14 +657,12 @@ class TourAPIService:
         if isinstance(intro, dict):
             result.update(intro)
 
+        if not result:
+            return result
+
         # 3) 캐시에 저장
         async with self._cache_lock:
-            import time
-            try:
-                self._detail_cache[cache_key] = (time.time(), result)
-            except Exception:
-                # 캐시 저장 실패는 무시 (메모리 제한 등)
-                pass
+            self._store_cache(self._detail_cache, cache_key, result, self._detail_cache_maxsize)
 
         return result
 
@@ -604,9 +774,11 @@ class TourAPIService:
         self,
         item: Dict[str, Any],
         detail: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> PlaceRow:
         """
         API 응답을 Place 모델 형식으로 변환
+
+        ORM 저장 시에는 dataclasses.asdict(row)로 dict 변환
         """
         content_type_id = int(item.get("contenttypeid", 12))
 
@@ -681,7 +853,7 @@ class TourAPIService:
         # 풍부한 태그 생성
         result["tags"] = self._generate_rich_tags(result)
 
-        return result
+        return PlaceRow(**result)
 
     def _generate_rich_tags(self, place_data: Dict[str, Any]) -> List[str]:
         """
@@ -701,14 +873,11 @@ class TourAPIService:
         if place_data.get("category"):
             tags.add(place_data["category"])
 
-        # 2. 지역
+        # 2. 지역 (주소에서 가장 앞에 나오는 지역명)
         addr = place_data.get("address", "")
-        for region in ["서울", "부산", "제주", "강원", "경주", "전주", "여수",
-                        "인천", "대구", "광주", "대전", "울산", "세종",
-                        "속초", "강릉", "춘천", "수원", "통영", "목포"]:
-            if region in addr:
-                tags.add(region)
-                break
+        region_match = _TAG_REGION_RE.search(addr) if addr else None
+        if region_match:
+            tags.add(region_match.group(0))
 
         # 3. cat1 대분류 매핑 (cat3 없어도 기본 태그 확보)
         cat1 = place_data.get("cat1", "")
@@ -739,27 +908,21 @@ class TourAPIService:
 
     def _clean_html(self, text: str) -> str:
         """HTML 태그 및 불필요한 문자 제거"""
-        if not text:
+        if not text or not isinstance(text, str):
             return ""
-
-        import re
-        # HTML 태그 제거
-        text = re.sub(r'<[^>]+>', '', text)
-        # HTML 엔티티 변환
-        text = text.replace("&nbsp;", " ")
-        text = text.replace("&amp;", "&")
-        text = text.replace("&lt;", "<")
-        text = text.replace("&gt;", ">")
-        text = text.replace("&quot;", '"')
-        # 연속 공백 제거
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return clean_html_cached(text)
 
 
 # 싱글톤 인스턴스
 _tour_api_instance = None
 
 
+async def close_tour_api_service() -> None:
+    """앱 종료 시 공유 HTTP 클라이언트(커넥션 풀) 정리"""
+    if _tour_api_instance is not None:
+        await _tour_api_instance._client.aclose()
+
+
 def get_tour_api_service() -> TourAPIService:
     global _tour_api_instance
     if _tour_api_instance is None:
@@ -1,5 +1,13 @@
+import os
+import pickle
+import logging
+import socket
+import asyncio
 import httpx
-from typing import Optional
+from typing import List, Optional
+from pybloom_live import ScalableBloomFilter
+
+logger = logging.getLogger(__name__)
 
 
 class WikipediaService:
@@ -12,6 +20,56 @@ class WikipediaService:
     BASE_URL = "https://ko.wikipedia.org/api/rest_v1"
     SEARCH_URL = "https://ko.wikipedia.org/w/api.php"
 
+    # 검색 결과가 없었던 관광지명 블룸 필터 저장 경로
+    MISS_CACHE_PATH = "data/wiki_miss_bloom.pkl"
+
+    def __init__(self):
+        # 검색 실패(known-miss) 관광지명 네거티브 캐시
+        self._miss_bloom = self._load_miss_bloom()
+        # 재사용 가능한 Async HTTP 클라이언트 (HTTP/2 + gzip/brotli 압축, TCP_NODELAY)
+        transport = httpx.AsyncHTTPTransport(
+            retries=1,
+            http2=True,
+            socket_options=[
+                (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ],
+        )
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            transport=transport,
+            headers={"Accept-Encoding": "gzip, br"},
+        )
+
+    def _load_miss_bloom(self) -> ScalableBloomFilter:
+        """디스크에 저장된 블룸 필터 로드 (없거나 손상되면 새로 생성)"""
+        if os.path.exists(self.MISS_CACHE_PATH):
+            try:
+                with open(self.MISS_CACHE_PATH, "rb") as f:
+                    return pickle.load(f)
+            except Exception as e:
+                logger.warning("Wikipedia 미스 캐시 로드 실패, 새로 생성", exc_info=e)
+
+        return ScalableBloomFilter(initial_capacity=100_000, error_rate=0.001)
+
+    def save_miss_cache(self) -> None:
+        """블룸 필터를 디스크에 저장 (서버 종료 시 호출, 실패해도 나머지 종료 처리는 계속)"""
+        try:
+            os.makedirs(os.path.dirname(self.MISS_CACHE_PATH), exist_ok=True)
+            with open(self.MISS_CACHE_PATH, "wb") as f:
+                pickle.dump(self._miss_bloom, f)
+        except Exception as e:
+            logger.warning("Wikipedia 미스 캐시 저장 실패", exc_info=e)
+
+    async def close(self) -> None:
+        """공유 HTTP 클라이언트(커넥션 풀) 정리 (서버 종료 시 호출)"""
+        await self._client.aclose()
+
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        """블룸 필터 키용 관광지명 정규화 (공백 제거 + 소문자)"""
+        return "".join(name.split()).lower()
+
     async def get_summary(self, title: str) -> Optional[str]:
         """
         Wikipedia 요약 정보 가져오기
@@ -26,16 +84,15 @@ class WikipediaService:
         endpoint = f"{self.BASE_URL}/page/summary/{title}"
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    endpoint,
-                    headers={"Accept": "application/json"},
-                    follow_redirects=True
-                )
+            response = await self._client.get(
+                endpoint,
+                headers={"Accept": "application/json"},
+                follow_redirects=True
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("extract", "")
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("extract", "")
 
         except Exception:
             pass
@@ -62,21 +119,22 @@ class WikipediaService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(self.SEARCH_URL, params=params)
+            response = await self._client.get(self.SEARCH_URL, params=params)
 
-                if response.status_code != 200:
-                    return None
+            if response.status_code != 200:
+                return None
 
-                data = response.json()
-                results = data.get("query", {}).get("search", [])
+            data = response.json()
+            results = data.get("query", {}).get("search", [])
 
-                if not results:
-                    return None
+            if not results:
+                # 검색 결과 없음만 기록 (네트워크 오류는 재시도 대상)
+                self._miss_bloom.add(self._normalize_name(query))
+                return None
 
-                # 2단계: 첫 번째 결과의 요약 가져오기
-                title = results[0].get("title", "")
-                return await self.get_summary(title)
+            # 2단계: 첫 번째 결과의 요약 가져오기
+            title = results[0].get("title", "")
+            return await self.get_summary(title)
 
         except Exception:
             pass
@@ -104,21 +162,57 @@ class WikipediaService:
         if current_description and len(current_description) >= min_length:
             return current_description
 
+        # 20자 이상이면 Wikipedia 결과를 병합하지 않으므로 요청 자체를 생략
+        if current_description and len(current_description) >= 20:
+            return current_description
+
+        # 이전에 검색 결과가 없었던 이름이면 네트워크 요청 생략
+        name_norm = self._normalize_name(place_name)
+        if name_norm in self._miss_bloom:
+            return current_description
+
         # Wikipedia에서 검색
         wiki_summary = await self.search_and_get_summary(place_name)
 
         if not wiki_summary:
             return current_description
 
-        # 기존 설명과 병합
+        # 기존 설명과 병합 (20자 미만의 짧은 설명만 여기까지 도달)
         if current_description:
-            # 중복 방지: 기존 설명의 핵심 키워드가 Wikipedia에 있는지 확인
-            if len(current_description) < 20:
-                return f"{current_description}\n\n{wiki_summary}"
-            else:
-                return current_description
-        else:
-            return wiki_summary
+            return f"{current_description}\n\n{wiki_summary}"
+        return wiki_summary
+
+    async def enhance_descriptions(
+        self,
+        place_names: List[str],
+        current_descriptions: Optional[List[Optional[str]]] = None,
+        min_length: int = 50,
+        concurrency: int = 5
+    ) -> List[Optional[str]]:
+        """
+        여러 관광지 설명을 동시에 보강 (수집 페이지 단위 일괄 처리용)
+
+        Args:
+            place_names: 관광지명 목록
+            current_descriptions: 각 관광지의 현재 설명 (place_names와 같은 순서)
+            min_length: 최소 설명 길이
+            concurrency: 동시 요청 수 제한
+
+        Returns:
+            place_names 순서대로 보강된 설명 목록
+        """
+        if current_descriptions is None:
+            current_descriptions = [None] * len(place_names)
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _enhance(name: str, desc: Optional[str]) -> Optional[str]:
+            async with sem:
+                return await self.enhance_description(name, desc, min_length)
+
+        return await asyncio.gather(
+            *(_enhance(name, desc) for name, desc in zip(place_names, current_descriptions))
+        )
 
 
 # 싱글톤 인스턴스
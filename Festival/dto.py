@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date
 
 
@@ -72,5 +72,5 @@ class FestivalCalendarResponse(BaseModel):
     success: bool
     year: int
     month: int
-    festivals_by_date: dict = Field(description="날짜별 축제 목록 {YYYYMMDD: [FestivalInfo, ...]}")
+    festivals_by_date: Dict[str, List[dict]] = Field(description="날짜별 축제 목록 {YYYYMMDD: [FestivalInfo, ...]}")
     total_count: int
\ No newline at end of file
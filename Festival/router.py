@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
-from datetime import date, datetime
+import re
+import hashlib
+import orjson
+from fastapi import APIRouter, HTTPException, Request, status, Query
+from fastapi.responses import ORJSONResponse, Response
+from typing import Optional, Any
+from datetime import date, timedelta
+from pydantic import BaseModel
 
-from core.database import provide_session
 from core.models import User
 from User.user_router import get_current_user
 
@@ -12,21 +15,63 @@ from Festival.dto import (
     FestivalSearchResponse,
     FestivalCalendarResponse
 )
-from Festival.service import get_festival_service
+from Festival.service import get_festival_service, today_provider
+from DataCollector.tour_api_service import get_tour_api_service, TourAPIRateLimitError
 
 
+# 캘린더/검색 응답은 수백 개의 축제를 담으므로 orjson으로 직렬화
 router = APIRouter(
     prefix="/festivals",
-    tags=["festivals"]
+    tags=["festivals"],
+    default_response_class=ORJSONResponse
 )
 
+# 싱글톤은 import 시점에 한 번만 바인딩 (요청마다 getter/inline import 호출 제거)
+_service = get_festival_service()
+_tour_api = get_tour_api_service()
+
+# YYYYMMDD (ASCII 숫자 8자리)
+_DATE_RE = re.compile(r"\d{8}", re.ASCII)
+
+# 지역 목록은 AREA_CODE 고정값이므로 응답 본문을 미리 직렬화해 둠
+_REGIONS_BODY = orjson.dumps({
+    "regions": list(_tour_api.AREA_CODE.keys()),
+    "message": "축제 검색 가능한 지역 목록"
+})
+
+
+
+def _orjson_default(obj: Any):
+    """orjson이 직접 처리하지 못하는 pydantic 모델(FestivalInfo 등) 직렬화"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError
+
+
+def _conditional_json_response(http_request: Request, payload: dict) -> Response:
+    """
+    ETag를 붙인 JSON 응답 (If-None-Match가 일치하면 본문 없이 304)
+
+    캘린더/인기 목록은 하루에 몇 번만 바뀌므로 반복 새로고침 시 전송량을 줄인다.
+    """
+    body = orjson.dumps(payload, default=_orjson_default)
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+
+    if http_request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 # ==================== 축제 검색 API ====================
 
-@router.post("/search", response_model=FestivalSearchResponse)
+# 핸들러가 이미 FestivalSearchResponse를 만들어 반환하므로 재검증 생략 (스키마는 문서용으로만 노출)
+@router.post(
+    "/search",
+    response_model=None,
+    responses={200: {"model": FestivalSearchResponse}}
+)
 async def search_festivals(
-    request: FestivalSearchRequest,
-    db: AsyncSession = Depends(provide_session)
+    request: FestivalSearchRequest
 ):
     """
     축제 검색
@@ -37,10 +82,9 @@ async def search_festivals(
     
     인증 불필요
     """
-    service = get_festival_service()
     
     try:
-        result = await service.search_festivals(db, request)
+        result = await _service.search_festivals(request)
         
         return FestivalSearchResponse(
             success=result["success"],
@@ -61,6 +105,7 @@ async def search_festivals(
 
 @router.get("/calendar/{year}/{month}")
 async def get_festival_calendar(
+    http_request: Request,
     year: int,
     month: int,
     region: Optional[str] = Query(None, description="지역 필터 (선택)"),
@@ -69,8 +114,7 @@ async def get_festival_calendar(
         ge=10, 
         le=365, 
         description="최대 축제 기간 (일). 이보다 긴 축제는 제외됩니다."
-    ),
-    db: AsyncSession = Depends(provide_session)
+    )
 ):
     """
     월별 축제 캘린더 (필터링 개선 버전)
@@ -104,18 +148,15 @@ async def get_festival_calendar(
             detail="월은 1~12 사이여야 합니다"
         )
     
-    service = get_festival_service()
-    
     try:
-        result = await service.get_festivals_by_month(
-            db, 
+        result = await _service.get_festivals_by_month(
             year, 
             month, 
             region,
             max_duration_days=max_duration  # ⭐ 필터링 파라미터 추가
         )
         
-        return {
+        return _conditional_json_response(http_request, {
             "success": result["success"],
             "year": result["year"],
             "month": result["month"],
@@ -124,7 +165,7 @@ async def get_festival_calendar(
             "excluded_count": result.get("excluded_count", 0),  # ⭐ 제외 통계
             "filter_applied": result.get("filter_applied", {}),
             "message": f"{result['total_count']}개 축제 ({result.get('excluded_count', 0)}개 제외됨)"
-        }
+        })
     
     except Exception as e:
         raise HTTPException(
@@ -137,8 +178,7 @@ async def get_festival_calendar(
 async def get_calendar_summary(
     year: int,
     month: int,
-    region: Optional[str] = Query(None, description="지역 필터 (선택)"),
-    db: AsyncSession = Depends(provide_session)
+    region: Optional[str] = Query(None, description="지역 필터 (선택)")
 ):
     """
     ⭐ 신규: 월별 캘린더 요약 (초경량 버전)
@@ -179,10 +219,8 @@ async def get_calendar_summary(
             detail="월은 1~12 사이여야 합니다"
         )
     
-    service = get_festival_service()
-    
     try:
-        result = await service.get_calendar_summary(db, year, month, region)
+        result = await _service.get_calendar_summary(year, month, region)
         
         return result
     
@@ -196,8 +234,7 @@ async def get_calendar_summary(
 @router.get("/calendar/date/{date_str}")
 async def get_festivals_by_specific_date(
     date_str: str,
-    region: Optional[str] = Query(None, description="지역 필터 (선택)"),
-    db: AsyncSession = Depends(provide_session)
+    region: Optional[str] = Query(None, description="지역 필터 (선택)")
 ):
     """
     ⭐ 신규: 특정 날짜의 축제 목록
@@ -211,27 +248,22 @@ async def get_festivals_by_specific_date(
     인증 불필요
     """
     # 날짜 형식 검증
-    if not date_str.isdigit() or len(date_str) != 8:
+    if not _DATE_RE.fullmatch(date_str):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="날짜 형식이 올바르지 않습니다 (YYYYMMDD 형식, 예: 20250301)"
         )
     try:
-        target_date = datetime.strptime(date_str, "%Y%m%d").date()
+        target_date = date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="날짜 형식이 올바르지 않습니다 (YYYYMMDD 형식)"
         )
     
-    year = target_date.year
-    month = target_date.month
-    
-    service = get_festival_service()
-    
     try:
-        # 해당 월 데이터 가져오기
-        result = await service.get_festivals_by_month(db, year, month, region)
+        # 해당 날짜에 진행 중인 축제만 조회
+        result = await _service.get_festivals_on_date(target_date, region)
         
         if not result["success"]:
             return {
@@ -241,8 +273,7 @@ async def get_festivals_by_specific_date(
                 "message": "축제를 찾을 수 없습니다."
             }
         
-        # 특정 날짜의 축제만 추출
-        festivals_on_date = result["festivals_by_date"].get(date_str, [])
+        festivals_on_date = result["festivals"]
         
         return {
             "success": True,
@@ -264,8 +295,7 @@ async def get_festivals_by_specific_date(
 @router.get("/ongoing")
 async def get_ongoing_festivals(
     region: Optional[str] = Query(None, description="지역 필터 (선택)"),
-    max_items: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(provide_session)
+    max_items: int = Query(20, ge=1, le=100)
 ):
     """
     현재 진행 중인 축제
@@ -274,10 +304,9 @@ async def get_ongoing_festivals(
     
     인증 불필요
     """
-    service = get_festival_service()
     
     try:
-        result = await service.get_ongoing_festivals(db, region, max_items)
+        result = await _service.get_ongoing_festivals(region, max_items)
         
         return {
             "success": result["success"],
@@ -298,8 +327,7 @@ async def get_ongoing_festivals(
 async def get_upcoming_festivals(
     region: Optional[str] = Query(None, description="지역 필터 (선택)"),
     days: int = Query(30, ge=1, le=365, description="앞으로 N일 이내"),
-    max_items: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(provide_session)
+    max_items: int = Query(20, ge=1, le=100)
 ):
     """
     예정된 축제
@@ -308,28 +336,13 @@ async def get_upcoming_festivals(
     
     인증 불필요
     """
-    from datetime import timedelta
-    
-    today = datetime.now().date()
+    today = today_provider()
     end_date = today + timedelta(days=days)
     
-    service = get_festival_service()
-    
     try:
-        request = FestivalSearchRequest(
-            region=region,
-            start_date=today,
-            end_date=end_date,
-            max_items=max_items
-        )
-        
-        result = await service.search_festivals(db, request)
-        
-        # 예정된 것만 필터링
-        upcoming = [f for f in result["festivals"] if f.is_upcoming]
-        
-        # 시작일 임박순 정렬
-        upcoming.sort(key=lambda x: x.days_until_start if x.days_until_start else 999)
+        # 예정 필터링 + 시작일 임박순 정렬은 서비스에서 처리
+        result = await _service.get_upcoming_festivals(region, today, end_date, max_items)
+        upcoming = result["festivals"]
         
         return {
             "success": True,
@@ -351,18 +364,19 @@ async def get_upcoming_festivals(
 
 
 @router.delete("/calendar/cache")
-async def clear_festival_calendar_cache():
+async def clear_festival_calendar_cache(
+    year: Optional[int] = Query(None, description="특정 연도만 삭제 (month와 함께 사용)"),
+    month: Optional[int] = Query(None, ge=1, le=12, description="특정 월만 삭제 (year와 함께 사용)")
+):
     """
     캘린더 캐시 수동 초기화
 
     데이터 갱신 후 즉시 반영이 필요할 때 사용 (TTL 기다리지 않고 강제 삭제)
+    year/month를 지정하면 해당 월만, 없으면 전체 삭제
 
     인증 불필요
     """
-    service = get_festival_service()
-    count = len(service._calendar_cache)
-    service._calendar_cache.clear()
-    service._calendar_cache_time.clear()
+    count = _service.clear_calendar_cache(year, month)
     return {"success": True, "message": f"캘린더 캐시 {count}건 삭제됨"}
 
 
@@ -373,21 +387,18 @@ async def get_available_regions():
     
     인증 불필요
     """
-    from DataCollector.tour_api_service import get_tour_api_service
-    
-    tour_api = get_tour_api_service()
-    
-    return {
-        "regions": list(tour_api.AREA_CODE.keys()),
-        "message": "축제 검색 가능한 지역 목록"
-    }
+    return Response(
+        content=_REGIONS_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=86400"}
+    )
 
 
 @router.get("/popular")
 async def get_popular_festivals(
+    http_request: Request,
     limit: int = Query(10, ge=1, le=50, description="최대 결과 수"),
-    region: Optional[str] = Query(None, description="지역 필터 (선택)"),
-    db: AsyncSession = Depends(provide_session)
+    region: Optional[str] = Query(None, description="지역 필터 (선택)")
 ):
     """
     인기 축제 목록 (홈 화면용)
@@ -399,23 +410,10 @@ async def get_popular_festivals(
     
     인증 불필요
     """
-    from datetime import timedelta
-    
-    service = get_festival_service()
-    today = datetime.now().date()
-    
-    # 현재부터 3개월 후까지 검색
-    end_date = today + timedelta(days=90)
+    today = today_provider()
     
     try:
-        request = FestivalSearchRequest(
-            region=region,
-            start_date=today - timedelta(days=30),  # 30일 전부터 (현재 진행중 포함)
-            end_date=end_date,
-            max_items=100  # 넓게 가져와서 필터링
-        )
-        
-        result = await service.search_festivals(db, request)
+        result = await _service.get_popular_festivals(region, today, limit)
         
         if not result["success"]:
             return {
@@ -425,36 +423,7 @@ async def get_popular_festivals(
                 "message": "축제를 찾을 수 없습니다."
             }
         
-        festivals = result["festivals"]
-        
-        # 우선순위 정렬
-        def priority_score(festival):
-            """
-            우선순위 점수 계산
-            - 진행 중: 1000 + (종료까지 남은 일수)
-            - 예정: 500 - (시작까지 남은 일수)
-            - 종료: 0
-            """
-            if festival.is_ongoing:
-                return 1000 + (festival.days_until_end or 0)
-            elif festival.is_upcoming:
-                return 500 - (festival.days_until_start or 0)
-            else:
-                return 0
-        
-        # 정렬: 우선순위 높은 순
-        festivals.sort(key=priority_score, reverse=True)
-        
-        # 상위 N개만
-        popular = festivals[:limit]
-        
-        return {
-            "success": True,
-            "festivals": popular,
-            "total_count": len(popular),
-            "filters_applied": {"region": region},
-            "message": f"인기 축제 {len(popular)}개"
-        }
+        return _conditional_json_response(http_request, result)
     
     except Exception as e:
         raise HTTPException(
@@ -465,8 +434,7 @@ async def get_popular_festivals(
 
 @router.get("/{festival_id}/detail")
 async def get_festival_detail(
-    festival_id: int,
-    db: AsyncSession = Depends(provide_session)
+    festival_id: int
 ):
     """
     축제 상세 정보
@@ -475,36 +443,34 @@ async def get_festival_detail(
     
     인증 불필요
     """
-    from DataCollector.tour_api_service import get_tour_api_service, TourAPIRateLimitError
-
-    tour_api = get_tour_api_service()
-
     try:
         # 공통 정보 + 소개 정보 조회
-        detail = await tour_api.get_full_place_info(festival_id, 15)  # 15 = 축제공연행사
+        detail = await _tour_api.get_full_place_info(festival_id, 15)  # 15 = 축제공연행사
 
-        if detail is None:
+        if not detail:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="축제 정보를 찾을 수 없습니다"
             )
 
+        clean = _tour_api._clean_html
+
         # 필요한 정보만 추출
         return {
             "success": True,
             "festival": {
                 "id": festival_id,
                 "title": detail.get("title", ""),
-                "description": tour_api._clean_html(detail.get("overview", "")),
+                "description": clean(detail.get("overview", "")),
                 "address": f"{detail.get('addr1', '')} {detail.get('addr2', '')}".strip(),
                 "tel": detail.get("tel", ""),
                 "homepage": detail.get("homepage", ""),
                 "event_start_date": detail.get("eventstartdate"),
                 "event_end_date": detail.get("eventenddate"),
                 "event_place": detail.get("eventplace", ""),
-                "playtime": tour_api._clean_html(detail.get("playtime", "")),
-                "program": tour_api._clean_html(detail.get("program", "")),
-                "usetimefestival": tour_api._clean_html(detail.get("usetimefestival", "")),
+                "playtime": clean(detail.get("playtime", "")),
+                "program": clean(detail.get("program", "")),
+                "usetimefestival": clean(detail.get("usetimefestival", "")),
                 "sponsor1": detail.get("sponsor1", ""),
                 "sponsor1tel": detail.get("sponsor1tel", ""),
             }
@@ -1,34 +1,98 @@
 import asyncio
-import traceback
-from typing import List, Optional, Dict, Any
+import heapq
+import logging
+import math
+import re
+import threading
+import time
+from calendar import monthrange
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Awaitable, Callable
 from datetime import datetime, date, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from DataCollector.tour_api_service import TourAPIService, get_tour_api_service
 from Festival.dto import FestivalInfo, FestivalSearchRequest
 from core.models import Place
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1024)
+def _parse_yyyymmdd(value: str) -> date:
+    """YYYYMMDD 문자열을 date로 변환 (같은 날짜 문자열은 캐시 재사용)"""
+    return date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+
+
+def _format_yyyymmdd(value: date) -> str:
+    """date를 TourAPI 형식(YYYYMMDD) 문자열로 변환 (strftime 포맷 해석 생략)"""
+    return f"{value.year:04d}{value.month:02d}{value.day:02d}"
+
+
+@lru_cache(maxsize=1)
+def _today_for_second(epoch_second: int) -> date:
+    return date.today()
+
+
+def today_provider() -> date:
+    """오늘 날짜 (같은 초 안의 동시 요청은 동일한 값을 공유)"""
+    return _today_for_second(int(time.time()))
+
+
+@dataclass(slots=True)
+class CalendarItem:
+    """캘린더 UI용 축제 요약 (축제당 하나, 날짜별 목록이 같은 객체를 참조, orjson이 dict로 직렬화)"""
+    id: int
+    title: str
+    is_ongoing: bool
+    is_upcoming: bool
+    event_start_date: Optional[str]
+    event_end_date: Optional[str]
+    image_url: Optional[str]
+    region: Optional[str]
+
 
 class FestivalService:
 
     _CACHE_TTL = 3600
+    _PAGE_SIZE = 50
+    # 프론트/Swagger 기본값 등 실제 검색어가 아닌 값
+    _PLACEHOLDER_KEYWORDS = frozenset({"string", "undefined", "null"})
 
     def __init__(self):
         self.tour_api = get_tour_api_service()
+        # 주소에서 지역명 탐지용 (긴 이름 우선, 주소 앞쪽에 나오는 지역명이 매칭됨)
+        self._region_re = re.compile("|".join(
+            re.escape(r) for r in sorted(self.tour_api.AREA_CODE.keys(), key=len, reverse=True)
+        ))
         self._calendar_cache: Dict[tuple, Dict] = {}
         self._calendar_cache_time: Dict[tuple, datetime] = {}
+        # 날짜별 요약(개수 + 대표 1개)은 월 캘린더 생성 시 함께 만들어 같은 키로 저장
+        self._summary_cache: Dict[tuple, Dict[str, Any]] = {}
+        # 생성 중인 월별 캘린더 (cache_key → Future)
+        self._calendar_inflight: Dict[tuple, asyncio.Future] = {}
 
     # ==================== 1. 축제 조회 및 검색 로직 ====================
 
     async def search_festivals(
         self,
-        db: AsyncSession,
         request: FestivalSearchRequest,
-        fetch_detail: bool = True
+        fetch_detail: bool = True,
+        max_duration_days: Optional[int] = None,
+        calendar_items: bool = False
     ) -> Dict[str, Any]:
-        """축제 검색 메인 로직"""
-        print("DEBUG Festival: search request =", request.dict())
+        """
+        축제 검색 메인 로직
+
+        max_duration_days가 주어지면 장기/연중 축제를 페이지 단위로 먼저 걸러내
+        max_items 한도를 실제 노출될 축제로만 채운다 (제외 수는 excluded_count).
+        calendar_items=True면 상세 조회 없이 캘린더용 요약(CalendarItem) 목록을 반환한다.
+        """
+        logger.debug("축제 검색 요청: %s", request.model_dump())
 
         # 1. 지역 코드 변환
         area_code = None
@@ -43,148 +107,129 @@ class FestivalService:
                     "filters_applied": {}
                 }
 
-        # 2. 날짜 기본값 설정 (없으면 오늘 ~ 3개월 후)
-        start_date = request.start_date
-        end_date = request.end_date
-        if not start_date or not end_date:
-            today_dt = datetime.now().date()
-            if not start_date:
-                start_date = today_dt
-            if not end_date:
-                end_date = today_dt + timedelta(days=90)
+        # 2. 날짜 기본값 설정 (없으면 오늘 ~ 3개월 후), 오늘 날짜는 변환에도 재사용
+        today = today_provider()
+        start_date = request.start_date or today
+        end_date = request.end_date or today + timedelta(days=90)
 
-        event_start_date = start_date.strftime("%Y%m%d") if start_date else None
-        event_end_date = end_date.strftime("%Y%m%d") if end_date else None
+        event_start_date = _format_yyyymmdd(start_date) if start_date else None
+        event_end_date = _format_yyyymmdd(end_date) if end_date else None
 
         # 3. 키워드 정제 (루프 밖에서 한 번만)
         kw = request.keyword
         if kw:
             kw = kw.strip()
-            if not kw or kw.lower() in ("string", "undefined", "null"):
+            if not kw or kw.lower() in self._PLACEHOLDER_KEYWORDS:
                 kw = None
 
-        # 4. TourAPI 호출
-        festivals = []
-        page = 1
+        # 4. TourAPI 호출 (필요한 페이지 수만큼 동시에 요청)
+        excluded_count = 0
 
         if kw:
             # 키워드 있으면 searchKeyword2 (contentTypeId=15: 축제/행사)
-            while len(festivals) < request.max_items:
-                try:
-                    raw_items = await self.tour_api.search_places(
-                        area_code=area_code,
-                        content_type_id=15,
-                        keyword=kw,
-                        page=page,
-                        num_of_rows=50
-                    )
-
-                    print(f"DEBUG raw_items type={type(raw_items)}, len={len(raw_items) if isinstance(raw_items, list) else 'N/A'}")
-
-                    # 리스트가 아닌 경우 방어
-                    if not raw_items or not isinstance(raw_items, list):
-                        break
-
-                    # str 등 비정상 항목 제거
-                    raw_items = [item for item in raw_items if isinstance(item, dict)]
-
-                    if not raw_items:
-                        break
-
-                    # 날짜 범위 로컬 필터링
-                    if event_start_date or event_end_date:
-                        filtered_items = []
-                        for item in raw_items:
-                            item_end = item.get("eventenddate", "")
-                            item_start = item.get("eventstartdate", "")
-                            if event_start_date and item_end and item_end < event_start_date:
-                                continue
-                            if event_end_date and item_start and item_start > event_end_date:
-                                continue
-                            filtered_items.append(item)
-                        raw_items = filtered_items
-
-                    festivals.extend(raw_items)
-
-                    if len(raw_items) < 50:
-                        break
-
-                    page += 1
-                    await asyncio.sleep(0.3)
-
-                except Exception as e:
-                    print(f"축제 키워드 검색 오류: {e}")
-                    traceback.print_exc()
-                    break
-
+            async def fetch_page(page: int):
+                return await self.tour_api.search_places(
+                    area_code=area_code,
+                    content_type_id=15,
+                    keyword=kw,
+                    page=page,
+                    num_of_rows=self._PAGE_SIZE
+                )
         else:
             # 키워드 없으면 searchFestival2
-            while len(festivals) < request.max_items:
-                try:
-                    raw_items = await self.tour_api.search_festivals(
-                        area_code=area_code,
-                        event_start_date=event_start_date,
-                        event_end_date=event_end_date,
-                        page=page,
-                        num_of_rows=50
-                    )
-
-                    if not raw_items:
-                        break
-
-                    # str 등 비정상 항목 제거
-                    raw_items = [item for item in raw_items if isinstance(item, dict)]
-
-                    if not raw_items:
-                        break
-
-                    festivals.extend(raw_items)
-
-                    if len(raw_items) < 50:
-                        break
-
-                    page += 1
-                    await asyncio.sleep(0.3)
-
-                except Exception as e:
-                    print(f"축제 검색 오류: {e}")
-                    traceback.print_exc()
-                    break
-
-        festivals = festivals[:request.max_items]
+            async def fetch_page(page: int):
+                return await self.tour_api.search_festivals(
+                    area_code=area_code,
+                    event_start_date=event_start_date,
+                    event_end_date=event_end_date,
+                    page=page,
+                    num_of_rows=self._PAGE_SIZE
+                )
+
+        # 페이지 경계/기간 중복으로 같은 contentid가 다시 오면 한 번만 채택 (상세 조회 중복 방지)
+        seen_ids = set()
+
+        def filter_page(raw_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            nonlocal excluded_count
+            unique_items = []
+            for item in raw_items:
+                content_id = item.get("contentid")
+                if content_id is not None:
+                    if content_id in seen_ids:
+                        continue
+                    seen_ids.add(content_id)
+                unique_items.append(item)
+            raw_items = unique_items
+
+            if max_duration_days is not None:
+                raw_items, dropped = self._drop_outlier_items(raw_items, max_duration_days)
+                excluded_count += dropped
+
+            # 키워드 검색은 기간 조건이 없으므로 날짜 범위 로컬 필터링
+            if kw and (event_start_date or event_end_date):
+                filtered_items = []
+                for item in raw_items:
+                    item_end = item.get("eventenddate", "")
+                    item_start = item.get("eventstartdate", "")
+                    if event_start_date and item_end and item_end < event_start_date:
+                        continue
+                    if event_end_date and item_start and item_start > event_end_date:
+                        continue
+                    filtered_items.append(item)
+                raw_items = filtered_items
+            return raw_items
 
         # 5. 상세 정보 조회 및 변환
-        today = datetime.now().date()
-
-        if fetch_detail:
-            concurrency = 10
+        if fetch_detail and not calendar_items:
+            # 요청 속도는 TourAPIService의 토큰 버킷이 제한하므로 세마포어는 동시 소켓 수만 제한
+            concurrency = 50
             sem = asyncio.Semaphore(concurrency)
 
-            async def _fetch_and_parse(item):
+            results: List[Optional[FestivalInfo]] = []
+
+            async def _fetch_into(index: int, item: Dict[str, Any]) -> None:
+                # 결과는 미리 확보한 자리에 직접 기록 (원래 순서 유지)
                 async with sem:
                     content_id = int(item.get("contentid", 0))
                     detail = None
                     try:
                         detail = await self.tour_api.get_full_place_info(content_id, 15)
                     except Exception as e:
-                        print(f"축제 상세 조회 실패 (ID: {content_id}): {e}")
+                        logger.warning("축제 상세 조회 실패 (ID: %s)", content_id, exc_info=e)
                     try:
-                        return self._parse_festival_data(item, detail, today)
+                        results[index] = self._parse_festival_data(item, detail, today)
                     except Exception as e:
-                        print(f"축제 데이터 변환 오류 (ID: {content_id}): {e}")
-                        return None
+                        logger.warning("축제 데이터 변환 오류 (ID: %s)", content_id, exc_info=e)
+
+            # 페이지가 병합되는 즉시 해당 항목의 상세 조회 시작 (남은 페이지 대기와 겹침)
+            # TaskGroup: 요청 취소/오류 시 남은 상세 조회도 함께 취소
+            async with asyncio.TaskGroup() as tg:
+                def start_details(items: List[Dict[str, Any]]) -> None:
+                    for item in items:
+                        results.append(None)
+                        tg.create_task(_fetch_into(len(results) - 1, item))
 
-            tasks = [_fetch_and_parse(item) for item in festivals]
-            results = await asyncio.gather(*tasks) if tasks else []
+                await self._collect_pages(fetch_page, filter_page, request.max_items, start_details)
 
         else:
+            festivals = await self._collect_pages(fetch_page, filter_page, request.max_items)
+            # 변환 함수는 루프 밖에서 한 번만 결정 (캘린더 경로는 DTO 검증/좌표 변환/상세 필드 생략)
+            if calendar_items:
+                parse = self._parse_festival_calendar
+            else:
+                parse_full = self._parse_festival_data
+
+                def parse(item: Dict[str, Any], today: date) -> FestivalInfo:
+                    return parse_full(item, None, today)
+
             results = []
+            append = results.append
             for item in festivals:
                 try:
-                    results.append(self._parse_festival_data(item, None, today))
+                    append(parse(item, today))
                 except Exception as e:
-                    print(f"축제 데이터 변환 오류 (ID: {item.get('contentid')}): {e}")
-                    results.append(None)
+                    logger.warning("축제 데이터 변환 오류 (ID: %s)", item.get("contentid"), exc_info=e)
+                    append(None)
 
         festival_infos = [r for r in results if r]
 
@@ -198,30 +243,132 @@ class FestivalService:
                 "end_date": end_date.isoformat() if end_date else None,
                 "keyword": request.keyword,
             },
+            "excluded_count": excluded_count,
             "message": f"{len(festival_infos)}개의 축제를 찾았습니다."
         }
 
+    async def _collect_pages(
+        self,
+        fetch_page: Callable[[int], Awaitable[Any]],
+        filter_page: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+        max_items: int,
+        on_items: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        max_items를 채우는 데 필요한 페이지들을 한 번에 동시 요청하고 페이지 순서대로 병합
+
+        짧은 페이지(마지막 페이지)나 오류를 만나면 중단하며, 필터링으로 부족하면
+        다음 페이지 묶음을 이어서 요청한다. 요청 제한(429)은 TourAPIService가 백오프 처리.
+        on_items가 주어지면 페이지에서 채택된 항목을 병합 즉시 전달한다.
+        """
+        festivals: List[Dict[str, Any]] = []
+        next_page = 1
+
+        while len(festivals) < max_items:
+            batch = math.ceil((max_items - len(festivals)) / self._PAGE_SIZE)
+            page_numbers = range(next_page, next_page + batch)
+            tasks = [asyncio.create_task(fetch_page(p)) for p in page_numbers]
+
+            try:
+                # 페이지 순서대로 병합하다가 목표 수량/마지막 페이지/오류에서 즉시 중단
+                for page, task in zip(page_numbers, tasks):
+                    try:
+                        raw_items = await task
+                    except Exception as e:
+                        logger.warning("축제 검색 오류 (page=%s)", page, exc_info=e)
+                        return festivals
+
+                    # 리스트가 아닌 경우 방어, str 등 비정상 항목 제거
+                    if not raw_items or not isinstance(raw_items, list):
+                        return festivals
+                    raw_items = [item for item in raw_items if isinstance(item, dict)]
+                    if not raw_items:
+                        return festivals
+
+                    page_size = len(raw_items)
+                    accepted = filter_page(raw_items)[:max_items - len(festivals)]
+                    festivals.extend(accepted)
+                    if on_items is not None and accepted:
+                        on_items(accepted)
+
+                    if len(festivals) >= max_items or page_size < self._PAGE_SIZE:
+                        return festivals
+            finally:
+                # 중단 시 아직 끝나지 않은 페이지 요청은 취소
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+
+            next_page += batch
+
+        return festivals
+
+    def _drop_outlier_items(self, raw_items: List[Dict[str, Any]], max_duration_days: int):
+        """TourAPI 원본 항목 중 장기/연중 축제 제거 → (남은 항목, 제외 수)"""
+        kept = []
+        for item in raw_items:
+            try:
+                f_start = _parse_yyyymmdd(item.get("eventstartdate", ""))
+                f_end = _parse_yyyymmdd(item.get("eventenddate", ""))
+            except ValueError:
+                # 날짜가 없거나 잘못된 항목은 호출부에서 처리
+                kept.append(item)
+                continue
+            if not self._is_outlier_duration(f_start, f_end, max_duration_days):
+                kept.append(item)
+        return kept, len(raw_items) - len(kept)
+
     async def get_festivals_by_month(
         self,
-        db: AsyncSession,
         year: int,
         month: int,
         region: Optional[str] = None,
-        max_duration_days: int = 10
+        max_duration_days: int = 10,
+        summarize: bool = False
     ) -> Dict[str, Any]:
-        """월별 축제 캘린더 데이터 생성"""
-        from calendar import monthrange
-        last_day = monthrange(year, month)[1]
+        """
+        월별 축제 캘린더 데이터 생성
 
+        summarize=True면 같은 생성 과정에서 함께 만든 날짜별 요약(개수 + 대표 1개)을 반환한다.
+        """
+        cache_key = (year, month, region, max_duration_days)
+        cached = self._get_cached_calendar(cache_key, datetime.now())
+        if cached is not None:
+            logger.debug("[FestivalCache] HIT (%s/%s, region=%s)", year, month, region)
+            data, dates = cached, self._summary_cache[cache_key]
+        else:
+            # 캐시가 비어 있을 때 동시에 들어온 요청은 하나의 생성 작업을 공유 (TourAPI 중복 호출 방지)
+            future = self._calendar_inflight.get(cache_key)
+            if future is None:
+                future = asyncio.ensure_future(
+                    self._build_month_calendar(year, month, region, max_duration_days)
+                )
+                self._calendar_inflight[cache_key] = future
+                future.add_done_callback(lambda _: self._calendar_inflight.pop(cache_key, None))
+            data, dates = await asyncio.shield(future)
+
+        if summarize and data["success"]:
+            return {
+                "success": True,
+                "year": year,
+                "month": month,
+                "dates": dates,
+                "total_festival_count": data["total_count"],
+                "excluded_count": data["excluded_count"]
+            }
+        return data
+
+    async def _build_month_calendar(
+        self,
+        year: int,
+        month: int,
+        region: Optional[str],
+        max_duration_days: int
+    ) -> tuple:
+        """월별 캘린더와 날짜별 요약을 한 번의 순회로 생성 후 캐시에 저장 → (캘린더, 요약)"""
+        last_day = monthrange(year, month)[1]
         cache_key = (year, month, region, max_duration_days)
         now = datetime.now()
-        if cache_key in self._calendar_cache:
-            elapsed = (now - self._calendar_cache_time[cache_key]).total_seconds()
-            if elapsed < self._CACHE_TTL:
-                print(f"[FestivalCache] HIT ({year}/{month}, region={region}) - {int(elapsed)}초 경과")
-                return self._calendar_cache[cache_key]
-            else:
-                print(f"[FestivalCache] EXPIRED ({year}/{month}, region={region})")
 
         month_start = date(year, month, 1)
         month_end = date(year, month, last_day)
@@ -235,129 +382,203 @@ class FestivalService:
             max_items=200
         )
 
-        result = await self.search_festivals(db, request, fetch_detail=False)
+        result = await self.search_festivals(
+            request, fetch_detail=False, max_duration_days=max_duration_days,
+            calendar_items=True
+        )
         if not result["success"]:
-            return result
+            return result, None
+
+        # 해당 월의 날짜 키를 한 번만 만들어 두고 축제별로 구간만 잘라 사용
+        day_keys = [f"{year:04d}{month:02d}{day:02d}" for day in range(1, last_day + 1)]
 
-        festivals_by_date = {}
+        festivals_by_date = defaultdict(list)
         filtered_festivals = []
-        excluded_count = 0
+        excluded_count = result.get("excluded_count", 0)
 
-        for festival in result["festivals"]:
-            if not festival.event_start_date or not festival.event_end_date:
-                excluded_count += 1
+        # 날짜별 대표 축제 (순위, 항목): 진행 중(0) > 예정(1) > 그 외(2), 같은 순위는 먼저 온 축제
+        representatives: Dict[str, tuple] = {}
+
+        # 루프에서 반복 참조하는 전역/속성은 지역 변수로
+        parse_date = _parse_yyyymmdd
+        by_date = festivals_by_date
+
+        # ±60일 검색 결과 중 이 달과 겹치지 않는 축제는 문자열 비교만으로 먼저 제외
+        # (YYYYMMDD 문자열은 사전순 비교가 날짜 비교와 동일)
+        first_key, last_key = day_keys[0], day_keys[-1]
+
+        for item in result["festivals"]:
+            f_start_str, f_end_str = item.event_start_date, item.event_end_date
+            if f_start_str and f_end_str and (f_end_str < first_key or f_start_str > last_key):
                 continue
-            try:
-                f_start = datetime.strptime(festival.event_start_date, "%Y%m%d").date()
-                f_end = datetime.strptime(festival.event_end_date, "%Y%m%d").date()
-
-                duration = (f_end - f_start).days
-                if (duration > max_duration_days) or (duration >= 300) or (
-                    f_start.month == 1 and f_start.day == 1 and
-                    f_end.month == 12 and f_end.day == 31
-                ):
-                    excluded_count += 1
-                    continue
-
-                if f_end < month_start or f_start > month_end:
-                    continue
-
-                current_date = max(f_start, month_start)
-                while current_date <= min(f_end, month_end):
-                    date_key = current_date.strftime("%Y%m%d")
-                    if date_key not in festivals_by_date:
-                        festivals_by_date[date_key] = []
-                    festivals_by_date[date_key].append({
-                        "id": festival.id,
-                        "title": festival.title,
-                        "is_ongoing": festival.is_ongoing,
-                        "is_upcoming": festival.is_upcoming,
-                        "event_start_date": festival.event_start_date,
-                        "event_end_date": festival.event_end_date,
-                        "image_url": festival.image_url,
-                        "region": festival.region,
-                    })
-                    current_date += timedelta(days=1)
-
-                filtered_festivals.append(festival)
 
-            except ValueError:
+            # 날짜 파싱은 lru_cache로 재사용 (없거나 잘못된 날짜는 제외)
+            try:
+                f_start = parse_date(f_start_str)
+                f_end = parse_date(f_end_str)
+            except (TypeError, ValueError):
                 excluded_count += 1
                 continue
 
+            # 축제당 캘린더 항목은 하나만 두고 날짜별로 같은 객체를 참조
+            rank = 0 if item.is_ongoing else 1 if item.is_upcoming else 2
+            first_day = f_start.day if f_start > month_start else 1
+            last_in_month = f_end.day if f_end < month_end else last_day
+            for date_key in day_keys[first_day - 1:last_in_month]:
+                by_date[date_key].append(item)
+                current = representatives.get(date_key)
+                if current is None or rank < current[0]:
+                    representatives[date_key] = (rank, item)
+
+            filtered_festivals.append(item)
+
+        sorted_keys = sorted(festivals_by_date)
         response = {
             "success": True,
             "year": year,
             "month": month,
-            "festivals_by_date": festivals_by_date,
+            # 날짜순 정렬된 일반 dict로 반환 (클라이언트 정렬 불필요)
+            "festivals_by_date": {k: festivals_by_date[k] for k in sorted_keys},
             "total_count": len(filtered_festivals),
             "excluded_count": excluded_count,
             "filter_applied": {"max_duration_days": max_duration_days, "region": region}
         }
 
+        projected: Dict[int, Dict[str, Any]] = {}
+        dates = {
+            k: {
+                "count": len(festivals_by_date[k]),
+                "representative": self._project_representative(representatives[k][1], projected)
+            }
+            for k in sorted_keys
+        }
+
         self._calendar_cache[cache_key] = response
         self._calendar_cache_time[cache_key] = now
-        print(f"[FestivalCache] STORED ({year}/{month}, region={region}) - TTL {self._CACHE_TTL}초")
+        self._summary_cache[cache_key] = dates
+        logger.debug("[FestivalCache] STORED (%s/%s, region=%s) - TTL %s초", year, month, region, self._CACHE_TTL)
+
+        return response, dates
+
+    async def get_festivals_on_date(
+        self,
+        target_date: date,
+        region: Optional[str] = None,
+        max_duration_days: int = 10
+    ) -> Dict[str, Any]:
+        """
+        특정 날짜에 진행 중인 축제 목록 (캘린더 날짜 클릭용)
+
+        해당 월 캘린더가 캐시되어 있으면 그대로 사용하고, 없으면 월 전체(±60일)
+        대신 event_start_date <= 날짜 <= event_end_date 조건으로 그 날짜만 조회한다.
+        """
+        date_key = _format_yyyymmdd(target_date)
+
+        cache_key = (target_date.year, target_date.month, region, max_duration_days)
+        cached = self._get_cached_calendar(cache_key, datetime.now())
+        if cached is not None:
+            return {"success": True, "festivals": cached["festivals_by_date"].get(date_key, [])}
+
+        request = FestivalSearchRequest(
+            region=region,
+            start_date=target_date,
+            end_date=target_date,
+            max_items=200
+        )
+        result = await self.search_festivals(
+            request, fetch_detail=False, max_duration_days=max_duration_days,
+            calendar_items=True
+        )
+        if not result["success"]:
+            return result
 
-        return response
+        festivals_on_date = []
+        for item in result["festivals"]:
+            f_start_str, f_end_str = item.event_start_date, item.event_end_date
+            if not f_start_str or not f_end_str:
+                continue
+            # YYYYMMDD 문자열은 사전순 비교가 날짜 비교와 동일
+            if not (f_start_str <= date_key <= f_end_str):
+                continue
+            festivals_on_date.append(item)
+
+        return {"success": True, "festivals": festivals_on_date}
+
+    def _get_cached_calendar(self, cache_key: tuple, now: datetime) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 월별 캘린더 반환 (만료 시 삭제 후 None)
+
+        TTL 외에도 날짜가 바뀌면 만료시킨다 (is_ongoing/is_upcoming이 오늘 기준이므로).
+        """
+        stored_at = self._calendar_cache_time.get(cache_key)
+        if stored_at is None:
+            return None
+
+        if (now - stored_at).total_seconds() < self._CACHE_TTL and stored_at.date() == now.date():
+            return self._calendar_cache[cache_key]
+
+        self._calendar_cache.pop(cache_key, None)
+        self._calendar_cache_time.pop(cache_key, None)
+        self._summary_cache.pop(cache_key, None)
+        return None
+
+    def clear_calendar_cache(self, year: Optional[int] = None, month: Optional[int] = None) -> int:
+        """
+        캘린더 캐시 삭제, 삭제된 항목 수 반환
+
+        year/month를 주면 해당 월(모든 지역/기간 필터)만, 없으면 전체 삭제
+        """
+        if year is None or month is None:
+            count = len(self._calendar_cache)
+            self._calendar_cache.clear()
+            self._calendar_cache_time.clear()
+            self._summary_cache.clear()
+            return count
+
+        keys = [k for k in self._calendar_cache if k[0] == year and k[1] == month]
+        for key in keys:
+            self._calendar_cache.pop(key, None)
+            self._calendar_cache_time.pop(key, None)
+            self._summary_cache.pop(key, None)
+        return len(keys)
+
+    @staticmethod
+    def _is_outlier_duration(f_start: date, f_end: date, max_duration_days: int) -> bool:
+        """캘린더에서 제외할 장기/연중 축제 여부"""
+        duration = (f_end - f_start).days
+        return (duration > max_duration_days) or (duration >= 300) or (
+            f_start.month == 1 and f_start.day == 1 and
+            f_end.month == 12 and f_end.day == 31
+        )
+
+    @staticmethod
+    def _project_representative(
+        item: CalendarItem,
+        projected: Dict[int, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """대표 축제를 요약에 필요한 3개 필드로만 축약 (같은 축제는 한 번만 생성)"""
+        rep = projected.get(item.id)
+        if rep is None:
+            rep = {"id": item.id, "title": item.title, "image_url": item.image_url}
+            projected[item.id] = rep
+        return rep
 
     async def get_calendar_summary(
         self,
-        db: AsyncSession,
         year: int,
         month: int,
         region: Optional[str] = None
     ) -> Dict[str, Any]:
         """캘린더용 초경량 요약 데이터 (날짜별 축제 개수 + 대표 1개)"""
-        full_data = await self.get_festivals_by_month(db, year, month, region)
-        if not full_data["success"]:
-            return full_data
-
-        summary = {}
-        for date_key, festivals in full_data["festivals_by_date"].items():
-            if not festivals:
-                continue
-
-            representative = None
-            for fest in festivals:
-                if fest.get("is_ongoing"):
-                    representative = fest
-                    break
-            if not representative:
-                for fest in festivals:
-                    if fest.get("is_upcoming"):
-                        representative = fest
-                        break
-            if not representative:
-                representative = festivals[0]
-
-            summary[date_key] = {
-                "count": len(festivals),
-                "representative": {
-                    "id": representative["id"],
-                    "title": representative["title"],
-                    "image_url": representative.get("image_url")
-                }
-            }
-
-        return {
-            "success": True,
-            "year": year,
-            "month": month,
-            "dates": summary,
-            "total_festival_count": full_data["total_count"],
-            "excluded_count": full_data["excluded_count"]
-        }
+        return await self.get_festivals_by_month(year, month, region, summarize=True)
 
     async def get_ongoing_festivals(
         self,
-        db: AsyncSession,
         region: Optional[str] = None,
         max_items: int = 20
     ) -> Dict[str, Any]:
         """현재 진행 중인 축제 필터링 조회"""
-        from calendar import monthrange
-        today = datetime.now().date()
+        today = today_provider()
         start_date = date(today.year, today.month, 1)
 
         if today.month == 12:
@@ -369,7 +590,7 @@ class FestivalService:
         request = FestivalSearchRequest(
             region=region, start_date=start_date, end_date=end_date, max_items=100
         )
-        result = await self.search_festivals(db, request)
+        result = await self.search_festivals(request)
 
         ongoing = [f for f in result["festivals"] if f.is_ongoing]
         return {
@@ -380,6 +601,102 @@ class FestivalService:
             "message": f"현재 진행 중인 축제 {len(ongoing)}개"
         }
 
+    async def get_popular_festivals(
+        self,
+        region: Optional[str],
+        today: date,
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        """
+        인기 축제 목록 (진행 중 > 곧 시작 순)
+
+        목록 API 결과만으로 우선순위를 계산해 상위 limit개를 고른 뒤,
+        선택된 축제에 대해서만 상세 정보를 조회한다.
+        """
+        request = FestivalSearchRequest(
+            region=region,
+            start_date=today - timedelta(days=30),  # 30일 전부터 (현재 진행중 포함)
+            end_date=today + timedelta(days=90),
+            max_items=100  # 넓게 가져와서 필터링
+        )
+        result = await self.search_festivals(request, fetch_detail=False)
+        if not result["success"]:
+            return result
+
+        def priority_score(festival: FestivalInfo) -> int:
+            """
+            우선순위 점수 계산
+            - 진행 중: 1000 + (종료까지 남은 일수)
+            - 예정: 500 - (시작까지 남은 일수)
+            - 종료: 0
+            """
+            if festival.is_ongoing:
+                return 1000 + (festival.days_until_end or 0)
+            elif festival.is_upcoming:
+                return 500 - (festival.days_until_start or 0)
+            return 0
+
+        # 전체 정렬 대신 상위 limit개만 선택 (sorted(...)[:limit]과 동일한 안정 순서)
+        top = heapq.nlargest(limit, result["festivals"], key=priority_score)
+
+        popular = await self._attach_details(top)
+
+        return {
+            "success": True,
+            "festivals": popular,
+            "total_count": len(popular),
+            "filters_applied": {"region": region},
+            "message": f"인기 축제 {len(popular)}개"
+        }
+
+    async def get_upcoming_festivals(
+        self,
+        region: Optional[str],
+        today: date,
+        end_date: date,
+        max_items: int = 20
+    ) -> Dict[str, Any]:
+        """
+        today 이후 end_date 이내에 시작하는 축제 (시작일 임박순)
+
+        목록 API 결과에서 예정 축제만 골라 정렬한 뒤, 남은 축제에 대해서만
+        상세 정보를 조회한다 (진행 중 축제의 상세 조회 생략).
+        """
+        request = FestivalSearchRequest(
+            region=region,
+            start_date=today,
+            end_date=end_date,
+            max_items=max(max_items, 10)  # FestivalSearchRequest 최소값
+        )
+        result = await self.search_festivals(request, fetch_detail=False)
+        if not result["success"]:
+            return result
+
+        end_key = _format_yyyymmdd(end_date)
+        upcoming = sorted(
+            (f for f in result["festivals"]
+             if f.is_upcoming and f.event_start_date <= end_key),
+            key=lambda f: f.event_start_date
+        )[:max_items]
+
+        return {
+            "success": True,
+            "festivals": await self._attach_details(upcoming),
+            "total_count": len(upcoming),
+        }
+
+    async def _attach_details(self, festivals: List[FestivalInfo]) -> List[FestivalInfo]:
+        """목록 API로 만든 FestivalInfo에 상세 정보를 병렬 조회해 채움"""
+        details = await asyncio.gather(
+            *(self.tour_api.get_full_place_info(f.id, 15) for f in festivals),
+            return_exceptions=True
+        )
+        return [
+            f.model_copy(update=self._parse_detail_fields(f.id, d, f.tel))
+            if isinstance(d, dict) else f
+            for f, d in zip(festivals, details)
+        ]
+
     def _parse_festival_data(
         self,
         item: Dict[str, Any],
@@ -390,7 +707,8 @@ class FestivalService:
         content_id = int(item.get("contentid", 0))
         title = item.get("title", "")
         address = f"{item.get('addr1', '')} {item.get('addr2', '')}".strip()
-        region = next((r for r in self.tour_api.AREA_CODE.keys() if r in address), None)
+        region_match = self._region_re.search(address)
+        region = region_match.group(0) if region_match else None
         latitude = float(item.get("mapy", 0)) if item.get("mapy") else None
         longitude = float(item.get("mapx", 0)) if item.get("mapx") else None
         event_start_date = item.get("eventstartdate")
@@ -399,8 +717,8 @@ class FestivalService:
         is_ongoing, is_upcoming, d_start, d_end = False, False, None, None
         if event_start_date and event_end_date:
             try:
-                s_dt = datetime.strptime(event_start_date, "%Y%m%d").date()
-                e_dt = datetime.strptime(event_end_date, "%Y%m%d").date()
+                s_dt = _parse_yyyymmdd(event_start_date)
+                e_dt = _parse_yyyymmdd(event_end_date)
                 if s_dt <= today <= e_dt:
                     is_ongoing, d_end = True, (e_dt - today).days
                 elif today < s_dt:
@@ -408,34 +726,79 @@ class FestivalService:
             except ValueError:
                 pass
 
-        tel = item.get("tel", "")
+        return FestivalInfo(
+            id=content_id, title=title, address=address, region=region,
+            event_start_date=event_start_date, event_end_date=event_end_date,
+            latitude=latitude, longitude=longitude,
+            image_url=item.get("firstimage") or item.get("firstimage2"),
+            is_ongoing=is_ongoing, is_upcoming=is_upcoming,
+            days_until_start=d_start, days_until_end=d_end,
+            **self._parse_detail_fields(content_id, detail, item.get("tel", ""))
+        )
+
+    def _parse_festival_calendar(self, item: Dict[str, Any], today: date) -> CalendarItem:
+        """API 원본 데이터를 캘린더 UI용 축제 요약으로 변환 (pydantic DTO 검증 생략)"""
+        event_start_date = item.get("eventstartdate")
+        event_end_date = item.get("eventenddate")
+
+        is_ongoing = is_upcoming = False
+        if event_start_date and event_end_date:
+            try:
+                s_dt = _parse_yyyymmdd(event_start_date)
+                e_dt = _parse_yyyymmdd(event_end_date)
+                is_ongoing = s_dt <= today <= e_dt
+                is_upcoming = today < s_dt
+            except ValueError:
+                pass
+
+        region_match = self._region_re.search(f"{item.get('addr1', '')} {item.get('addr2', '')}")
+        return CalendarItem(
+            id=int(item.get("contentid", 0)),
+            title=item.get("title", ""),
+            is_ongoing=is_ongoing,
+            is_upcoming=is_upcoming,
+            event_start_date=event_start_date,
+            event_end_date=event_end_date,
+            image_url=item.get("firstimage") or item.get("firstimage2"),
+            region=region_match.group(0) if region_match else None,
+        )
+
+    def _parse_detail_fields(
+        self,
+        content_id: int,
+        detail: Optional[Dict[str, Any]],
+        tel: Optional[str]
+    ) -> Dict[str, Any]:
+        """상세 API 응답에서 FestivalInfo 상세 필드 추출"""
         desc = home = e_place = p_time = prog = fee = None
 
         if detail:
             try:
                 if isinstance(detail, dict):
-                    desc = self.tour_api._clean_html(detail.get("overview", ""))
+                    clean_html = self.tour_api._clean_html
+
+                    def clean(key: str) -> str:
+                        # 비어 있는 필드는 HTML 정리 호출 없이 바로 "" 반환
+                        value = detail.get(key)
+                        return clean_html(value) if value else ""
+
+                    desc = clean("overview")
                     tel = detail.get("tel", "") or tel
                     home = detail.get("homepage", "")
                     e_place = detail.get("eventplace", "")
-                    p_time = self.tour_api._clean_html(detail.get("playtime", ""))
-                    prog = self.tour_api._clean_html(detail.get("program", ""))
-                    fee = self.tour_api._clean_html(detail.get("usetimefestival", ""))
+                    p_time = clean("playtime")
+                    prog = clean("program")
+                    fee = clean("usetimefestival")
                 else:
-                    print(f"WARNING Festival: unexpected detail type for {content_id}: {type(detail)}")
-            except Exception as ex:
-                print(f"ERROR Festival: parsing detail failed for {content_id}: {ex}")
-                traceback.print_exc()
+                    logger.warning("예상치 못한 상세 정보 타입 (ID: %s): %s", content_id, type(detail))
+            except Exception:
+                logger.exception("축제 상세 정보 파싱 실패 (ID: %s)", content_id)
+
+        return {
+            "description": desc, "tel": tel, "homepage": home, "event_place": e_place,
+            "playtime": p_time, "program": prog, "usetimefestival": fee,
+        }
 
-        return FestivalInfo(
-            id=content_id, title=title, address=address, region=region,
-            event_start_date=event_start_date, event_end_date=event_end_date,
-            latitude=latitude, longitude=longitude, description=desc,
-            image_url=item.get("firstimage") or item.get("firstimage2"),
-            tel=tel, homepage=home, event_place=e_place, playtime=p_time,
-            program=prog, usetimefestival=fee, is_ongoing=is_ongoing,
-            is_upcoming=is_upcoming, days_until_start=d_start, days_until_end=d_end
-        )
     # ==================== 2. DB 저장 및 관리 로직 ====================
 
     async def save_festival_as_place(
@@ -449,42 +812,100 @@ class FestivalService:
         if not detail:
             raise ValueError("축제 정보를 찾을 수 없습니다")
 
-        # 2. 중복 체크
-        title = detail.get("title", "")
-        existing = await db.execute(select(Place).where(Place.name == title, Place.is_festival == True))
-        existing_place = existing.scalar_one_or_none()
-        if existing_place:
-            return existing_place.id
+        # 2. 저장 (같은 이름의 축제 Place가 있으면 기존 id 반환, 왕복 1회)
+        result = await db.execute(
+            self._upsert_festival_places([self._festival_place_values(detail)]).returning(Place.id)
+        )
+        place_id = result.scalar_one()
+        await db.commit()
+
+        return place_id
 
-        # 3. 신규 Place 생성
-        place = Place(
-            name=title,
+    async def save_festivals_as_places(
+        self,
+        db: AsyncSession,
+        festival_ids: List[int]
+    ) -> Dict[int, int]:
+        """
+        여러 축제를 한 번에 Place 테이블에 저장 (festival_id → place_id)
+
+        상세 정보는 동시에 조회하고, 기존 Place 확인과 신규 저장은 upsert 1회로 처리한다.
+        상세 정보가 없는 축제는 결과에서 제외된다.
+        """
+        details = await asyncio.gather(
+            *(self.tour_api.get_full_place_info(fid, 15) for fid in festival_ids),
+            return_exceptions=True
+        )
+
+        title_by_id: Dict[int, str] = {}
+        detail_by_title: Dict[str, Dict[str, Any]] = {}
+        for fid, detail in zip(festival_ids, details):
+            if isinstance(detail, Exception):
+                logger.warning("축제 상세 조회 실패 (ID: %s)", fid, exc_info=detail)
+                continue
+            if not detail:
+                continue
+            title = detail.get("title", "")
+            title_by_id[fid] = title
+            detail_by_title.setdefault(title, detail)
+
+        if not title_by_id:
+            return {}
+
+        # 기존/신규 축제 Place id를 한 번에 확보 (이름은 위에서 중복 제거됨)
+        result = await db.execute(
+            self._upsert_festival_places(
+                [self._festival_place_values(detail) for detail in detail_by_title.values()]
+            ).returning(Place.id, Place.name)
+        )
+        place_id_by_title = {name: place_id for place_id, name in result.all()}
+        await db.commit()
+
+        return {fid: place_id_by_title[title] for fid, title in title_by_id.items()}
+
+    @staticmethod
+    def _upsert_festival_places(values: List[Dict[str, Any]]):
+        """
+        축제 Place INSERT ... ON CONFLICT (name) WHERE is_festival = true DO UPDATE
+
+        부분 유니크 인덱스 uq_places_festival_name 기준으로 기존 행은 이미지 URL만 보강하고,
+        DO UPDATE이므로 RETURNING이 기존 행의 id도 돌려준다 (동시 저장 시 중복 생성 방지).
+        """
+        stmt = pg_insert(Place).values(values)
+        return stmt.on_conflict_do_update(
+            index_elements=[Place.name],
+            index_where=text("is_festival = true"),
+            set_={"image_url": func.coalesce(stmt.excluded.image_url, Place.image_url)}
+        )
+
+    def _festival_place_values(self, detail: Dict[str, Any]) -> Dict[str, Any]:
+        """축제 상세 정보로 Place INSERT 값 생성"""
+        clean = self.tour_api._clean_html
+        return dict(
+            name=detail.get("title", ""),
             category="축제/행사",
             address=f"{detail.get('addr1', '')} {detail.get('addr2', '')}".strip(),
             latitude=float(detail.get("mapy", 0)) if detail.get("mapy") else 0.0,
             longitude=float(detail.get("mapx", 0)) if detail.get("mapx") else 0.0,
-            description=self.tour_api._clean_html(detail.get("overview", "")),
+            description=clean(detail.get("overview", "")),
             image_url=detail.get("firstimage"),
             tags=["축제"],
             is_festival=True,
             event_start_date=detail.get("eventstartdate"),
             event_end_date=detail.get("eventenddate"),
-            operating_hours=self.tour_api._clean_html(detail.get("playtime", "")),
-            fee_info=self.tour_api._clean_html(detail.get("usetimefestival", ""))
+            operating_hours=clean(detail.get("playtime", "")),
+            fee_info=clean(detail.get("usetimefestival", ""))
         )
 
-        db.add(place)
-        await db.commit()
-        await db.refresh(place)
-
-        return place.id
-
 
 # 싱글톤 관리
 _festival_service_instance = None
+_festival_service_lock = threading.Lock()
 
 def get_festival_service() -> FestivalService:
     global _festival_service_instance
     if _festival_service_instance is None:
-        _festival_service_instance = FestivalService()
+        with _festival_service_lock:
+            if _festival_service_instance is None:
+                _festival_service_instance = FestivalService()
     return _festival_service_instance
\ No newline at end of file
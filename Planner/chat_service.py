@@ -1,20 +1,62 @@
-import json
 import re
+import hashlib
 import logging
 import asyncio
+import time
+import threading
+import orjson
 from typing import List, Optional, Dict, Any
-from openai import OpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
+from core import database
 from core.config import get_config
-from core.models import ChatSession, Itinerary, Place, Trip
+from services.openai_service import get_openai_client
+from core.models import ChatSession, ChatSessionMessage, Itinerary, Place, Trip
 from Trip import crud as trip_crud
+from Trip.dto import ItineraryCreate, ItineraryUpdate, ItineraryReorderItem
 from Planner.dto import ChatRequest, ChatResponse, ChatMessage, ChangeItem
-from Planner.constants import REGION_PREFIX, CHAT_CONTEXT_LIMIT, CHAT_STORAGE_LIMIT, GPT_CHAT_MAX_TOKENS
+from Planner.constants import (
+    REGION_PREFIX, CHAT_CONTEXT_LIMIT, CHAT_CONTEXT_CHAR_BUDGET, CHAT_STORAGE_LIMIT, GPT_CHAT_MAX_TOKENS
+)
 
 logger = logging.getLogger(__name__)
 
+# GPT 응답 파싱 폴백용 (JSON 모드 응답은 바로 orjson.loads로 처리되므로 실패 시에만 사용)
+# 코드 블록(```json ... ```)으로 감싸져 있어도 가장 바깥 {...}만 잡으므로 펜스 제거가 따로 필요 없음
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+# 요청 메시지 → 카테고리 힌트 키워드
+_CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    "카페": ["카페", "커피", "디저트", "베이커리", "브런치"],
+    "맛집": ["맛집", "식당", "음식", "밥", "점심", "저녁", "먹을", "레스토랑",
+            "고기", "해산물", "국밥", "냉면", "분식", "피자", "치킨"],
+    "관광지": ["관광지", "명소", "관광", "여행지", "볼거리", "경치", "뷰"],
+    "문화시설": ["박물관", "미술관", "전시", "문화", "공연", "갤러리", "역사"],
+    "자연": ["공원", "산", "바다", "해변", "해수욕장", "자연", "트레킹", "등산", "숲"],
+    "쇼핑": ["쇼핑", "마트", "시장", "백화점", "쇼핑몰", "면세점"],
+    "체험": ["체험", "액티비티", "놀이", "테마파크", "워터파크"],
+}
+_FESTIVAL_HINT = "__festival__"
+_FESTIVAL_KEYWORDS = ["축제", "페스티벌", "festival", "행사", "이벤트"]
+
+# 키워드 → 카테고리 역인덱스와 전체 키워드 정규식 (메시지를 한 번만 스캔)
+# 긴 키워드를 먼저 두어 "해산물"이 "산"(자연)으로 잡히지 않도록 함
+_HINT_KEYWORD_CATEGORY: Dict[str, str] = {
+    kw: cat for cat, kws in _CATEGORY_KEYWORDS.items() for kw in kws
+}
+_HINT_KEYWORD_CATEGORY.update({kw: _FESTIVAL_HINT for kw in _FESTIVAL_KEYWORDS})
+_HINT_KEYWORD_RE = re.compile(
+    "|".join(re.escape(kw) for kw in sorted(_HINT_KEYWORD_CATEGORY, key=len, reverse=True))
+)
+
+# 스트리밍 응답에서 이 키가 나오면 앞부분(action_type·changes 등)은 완결된 상태
+_REPLY_TAIL_KEY = '"response_message"'
+
+# 장소명 토큰 교집합 매칭용 (2글자 이상 한글 단어)
+_HANGUL_TOKEN_RE = re.compile(r'[가-힣]{2,}')
+
 
 class ChatService:
     """대화형 일정 수정 서비스"""
@@ -48,6 +90,7 @@ class ChatService:
   늘릴 때는 추가 일차 일정을 자동 생성, 줄일 때는 마지막 일차부터 삭제
 - optimize_route: 현재 장소는 유지하고 이동 동선만 최적화
 - question: 추가 정보 필요
+- 장소를 가리킬 때는 이름과 함께 목록의 ID도 넣으세요 (추가 가능한 장소 [ID: n] → place_id, 현재 일정 [IID:n] → itinerary_id)
 
 ## 복합 요청 처리 원칙 (매우 중요)
 하나의 메시지에 여러 요청이 담겨있으면 반드시 changes 배열에 모든 액션을 담으세요.
@@ -83,6 +126,8 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
 {
   "understood": true,
   "action_type": "add|remove|replace|reorder|swap_places|swap_days|modify|regenerate|change_duration|optimize_route|compound|question",
+  "needs_confirmation": false,
+  "confirmation_question": null,
   "changes": [
     {
       "action": "modify",
@@ -94,10 +139,9 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
       "place_name": "덜 중요한 장소명"
     }
   ],
-  "response_message": "사용자에게 보여줄 친절한 응답",
-  "needs_confirmation": false,
-  "confirmation_question": null
+  "response_message": "사용자에게 보여줄 친절한 응답"
 }
+필드는 위 순서대로 출력하고 response_message는 항상 마지막에 두세요.
 
 ## replace 액션의 상세 필드
 {
@@ -113,87 +157,37 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
 - "아무 카페나", "뭔가 추가해줘"처럼 기준이 없는 요청 → needs_confirmation: true
 - 카테고리+일차가 명확하면 바로 처리 (needs_confirmation: false)
 
-## 예시 요청과 응답
-
-사용자: "2일차에 카페 하나 넣어줘"
-응답: {"action_type": "add", "changes": [{"action": "add", "category": "카페", "day_number": 2}], "response_message": "2일차에 카페를 추가할게요!", "needs_confirmation": false}
-
-사용자: "감천문화마을 빼줘"
-응답: {"action_type": "remove", "changes": [{"action": "remove", "place_name": "감천문화마을"}], "response_message": "감천문화마을을 일정에서 제거했어요.", "needs_confirmation": false}
-
-사용자: "사라오름 빼고 그자리 비워놔"
-응답: {"action_type": "remove", "changes": [{"action": "remove", "place_name": "사라오름", "no_fill": true}], "response_message": "사라오름을 빼고 그 자리를 비워뒀어요.", "needs_confirmation": false}
-
-사용자: "2일차 카페를 스타벅스 해운대점으로 바꿔줘"
-응답: {"action_type": "replace", "changes": [{"action": "replace", "day_number": 2, "source_place_id": null, "old_place": null, "target_category": "카페", "target_search_keyword": "스타벅스 해운대점"}], "response_message": "2일차 카페를 스타벅스 해운대점으로 교체할게요!", "needs_confirmation": false}
-
-사용자: "1일차 순서 바꿔줘, 해운대 먼저"
-응답: {"action_type": "reorder", "changes": [{"action": "reorder", "place_name": "해운대해수욕장", "day_number": 1, "new_order": 1}], "response_message": "해운대해수욕장을 1일차 첫 번째로 이동했어요.", "needs_confirmation": false}
-
-사용자: "해운대 체류시간 2시간으로 바꿔줘"
-응답: {"action_type": "modify", "changes": [{"action": "modify", "place_name": "해운대해수욕장", "stay_duration": 120}], "response_message": "해운대해수욕장 체류시간을 2시간으로 변경했어요.", "needs_confirmation": false}
-
-사용자: "1일차를 12시 이후로 조정하고 간소화해줘"
-응답: {"action_type": "compound", "changes": [{"action": "modify", "place_name": "1일차 첫 번째 장소명", "arrival_time": "12:00"}, {"action": "remove", "place_name": "1일차에서 덜 중요한 장소명"}], "response_message": "1일차 시작을 12시로 조정하고 장소 하나를 줄였어요!", "needs_confirmation": false}
-
-사용자: "오후 2시부터 시작하게 바꿔줘"
-응답: {"action_type": "modify", "changes": [{"action": "modify", "place_name": "첫 번째 장소명", "arrival_time": "14:00"}], "response_message": "첫 일정을 오후 2시부터 시작하도록 변경했어요. 이후 일정도 자동으로 조정됩니다.", "needs_confirmation": false}
-
-사용자: "일정이 너무 빡세"
-응답: {"action_type": "compound", "changes": [{"action": "remove", "place_name": "가장 덜 중요한 장소명"}, {"action": "modify", "place_name": "체류 시간이 짧은 장소명", "stay_duration": 90}], "response_message": "일정이 빡빡하군요! 장소 하나를 빼고 체류 시간도 여유있게 조정했어요.", "needs_confirmation": false}
-
-사용자: "간소화해줘"
-응답: {"action_type": "remove", "changes": [{"action": "remove", "place_name": "덜 중요한 장소명1", "no_fill": true}, {"action": "remove", "place_name": "덜 중요한 장소명2", "no_fill": true}], "response_message": "일정을 간소화했어요!", "needs_confirmation": false}
-
-사용자: "수월봉 빼고 일정 좀 넉넉하게 해줘"
-응답: {"action_type": "compound", "changes": [{"action": "remove", "place_name": "수월봉", "no_fill": true}, {"action": "remove", "place_name": "일정 중 덜 중요한 장소명", "no_fill": true}], "response_message": "수월봉을 빼고 장소 하나를 더 줄여서 여유있게 조정했어요.", "needs_confirmation": false}
-
-사용자: "힐링 테마로 전체 다시 짜줘"
-응답: {"action_type": "regenerate", "changes": [{"action": "regenerate", "scope": "full", "themes": ["힐링", "자연"], "requirements": "힐링·자연 위주, 복잡한 도심보다 조용한 명소"}], "response_message": "전체 일정을 힐링 테마로 새로 구성할게요!", "needs_confirmation": false}
-
-사용자: "2일차를 쇼핑 위주로 바꿔줘"
-응답: {"action_type": "regenerate", "changes": [{"action": "regenerate", "scope": 2, "themes": ["쇼핑"], "requirements": "쇼핑·맛집 위주로 배치"}], "response_message": "2일차를 쇼핑 중심으로 재구성할게요!", "needs_confirmation": false}
-
-사용자: "해운대랑 감천문화마을 자리 바꿔줘"
-응답: {"action_type": "swap_places", "changes": [{"action": "swap_places", "place_a": "해운대해수욕장", "place_b": "감천문화마을"}], "response_message": "해운대해수욕장과 감천문화마을의 순서를 교환할게요!", "needs_confirmation": false}
-
-사용자: "1일차랑 4일차 바꿔줘"
-응답: {"action_type": "swap_days", "changes": [{"action": "swap_days", "day_a": 1, "day_b": 4}], "response_message": "1일차와 4일차를 통째로 교환할게요!", "needs_confirmation": false}
-
-사용자: "동선이 너무 비효율적이야, 최적화해줘"
-응답: {"action_type": "optimize_route", "changes": [{"action": "optimize_route"}], "response_message": "이동 동선을 최적화할게요!", "needs_confirmation": false}
-
-사용자: "카페빼고 식당 2개 넣어줘"
-응답: {"action_type": "compound", "changes": [{"action": "remove", "place_name": "카페명"}, {"action": "add", "category": "맛집"}, {"action": "add", "category": "맛집"}], "response_message": "카페를 빼고 식당 2곳을 추가할게요!", "needs_confirmation": false}
-
-사용자: "하루 더 추가해줘"
-응답: {"action_type": "change_duration", "changes": [{"action": "change_duration", "delta_days": 1}], "response_message": "여행을 하루 늘려서 새 일차 일정을 만들게요!", "needs_confirmation": false}
-
-사용자: "이틀 줄여줘"
-응답: {"action_type": "change_duration", "changes": [{"action": "change_duration", "delta_days": -2}], "response_message": "여행을 이틀 줄이고 마지막 두 일차 일정을 삭제할게요!", "needs_confirmation": false}
-
-사용자: "야경 볼 수 있는 곳 추가해줘"
-응답: {"action_type": "add", "changes": [{"action": "add", "tags": ["야경", "뷰맛집"], "day_number": null}], "response_message": "야경 명소를 일정에 추가할게요!", "needs_confirmation": false}
-
-사용자: "포토스팟 하나 넣어줘"
-응답: {"action_type": "add", "changes": [{"action": "add", "tags": ["사진명소", "포토스팟", "전망"]}], "response_message": "사진 찍기 좋은 명소를 추가할게요!", "needs_confirmation": false}
-
-사용자: "체류시간 다 30분씩 줄여줘"
-응답: {"action_type": "bulk_modify", "changes": [{"action": "bulk_modify", "stay_duration_delta": -30}], "response_message": "전체 일정의 체류시간을 30분씩 줄였어요!", "needs_confirmation": false}
-
-사용자: "1일차 전체 1시간 앞당겨줘"
-응답: {"action_type": "bulk_modify", "changes": [{"action": "bulk_modify", "day_number": 1, "start_time_shift": -60}], "response_message": "1일차 일정을 1시간 앞당겼어요!", "needs_confirmation": false}
-
-사용자: "맛집 체류시간 다 1시간으로 맞춰줘"
-응답: {"action_type": "bulk_modify", "changes": [{"action": "bulk_modify", "category": "맛집", "stay_duration": 60}], "response_message": "식당 체류시간을 모두 1시간으로 조정했어요!", "needs_confirmation": false}
-
-사용자: "일정이 너무 빡빡해"
-응답: {"action_type": "compound", "changes": [{"action": "bulk_modify", "stay_duration_delta": -15}, {"action": "remove", "place_name": "덜 중요한 장소명"}], "response_message": "전체 체류시간을 15분씩 줄이고 장소 하나를 뺐어요. 좀 여유로워졌을 거예요!", "needs_confirmation": false}"""
+## 예시 (요청 → changes, 나머지 필드는 응답 형식과 동일)
+"2일차에 카페 하나 넣어줘" → [{"action": "add", "category": "카페", "day_number": 2}]
+"야경 볼 수 있는 곳 추가해줘" → [{"action": "add", "tags": ["야경", "뷰맛집"], "day_number": null}]
+"사라오름 빼고 그자리 비워놔" → [{"action": "remove", "place_name": "사라오름", "no_fill": true}]
+"2일차 카페를 스타벅스 해운대점으로 바꿔줘" → [{"action": "replace", "day_number": 2, "source_place_id": null, "old_place": null, "target_category": "카페", "target_search_keyword": "스타벅스 해운대점"}]
+"1일차 순서 바꿔줘, 해운대 먼저" → [{"action": "reorder", "place_name": "해운대해수욕장", "day_number": 1, "new_order": 1}]
+"해운대랑 감천문화마을 자리 바꿔줘" → [{"action": "swap_places", "place_a": "해운대해수욕장", "place_b": "감천문화마을"}]
+"1일차랑 4일차 바꿔줘" → [{"action": "swap_days", "day_a": 1, "day_b": 4}]
+"동선 최적화해줘" → [{"action": "optimize_route"}]
+"해운대 체류시간 2시간으로 바꿔줘" → [{"action": "modify", "place_name": "해운대해수욕장", "stay_duration": 120}]
+"2일차를 쇼핑 위주로 바꿔줘" → [{"action": "regenerate", "scope": 2, "themes": ["쇼핑"], "requirements": "쇼핑·맛집 위주로 배치"}]
+"이틀 줄여줘" → [{"action": "change_duration", "delta_days": -2}]
+"1일차 전체 1시간 앞당겨줘" → [{"action": "bulk_modify", "day_number": 1, "start_time_shift": -60}]
+"맛집 체류시간 다 1시간으로 맞춰줘" → [{"action": "bulk_modify", "category": "맛집", "stay_duration": 60}]
+"좀 바꿔줘" → [] (action_type: "question", response_message로 원하는 변경을 되묻기)
+"카페빼고 식당 2개 넣어줘" → [{"action": "remove", "place_name": "카페명"}, {"action": "add", "category": "맛집"}, {"action": "add", "category": "맛집"}]"""
 
     def __init__(self):
         config = get_config()
-        self.client = OpenAI(api_key=config.openai_api_key)
+        # 비동기 클라이언트: GPT 응답 대기 중에도 이벤트 루프가 다른 요청 처리 (공유 커넥션 풀)
+        self.client = get_openai_client()
         self.model = config.openai_model
+        # SYSTEM_PROMPT는 항상 첫 메시지로 고정 → OpenAI 자동 프롬프트 캐싱(prefix) 적중
+        # 프롬프트 해시를 캐시 키로 넘겨 같은 프롬프트 요청이 같은 캐시로 라우팅되도록 함 (프롬프트 변경 시 키도 변경)
+        self._prompt_cache_key = "chat-planner-" + hashlib.md5(self.SYSTEM_PROMPT.encode()).hexdigest()
+        # 후보 장소 ID 캐시 ((지역, 카테고리) → (저장 시각, 순위순 place_id 목록), 기본 60초)
+        # 같은 대화의 연속 턴은 카테고리별 조회를 건너뛰고 PK 조회 한 번으로 복원
+        # ORM 객체는 요청 세션에 묶여 있으므로 ID만 보관
+        self._places_cache: Dict[tuple, tuple] = {}
+        self._places_cache_ttl = 60
+        self._places_cache_maxsize = 256
 
     def _parse_time_value(self, val):
         """문자열 'HH:MM'을 time 객체로 변환하거나 이미 time이면 그대로 반환."""
@@ -215,7 +209,8 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         self,
         db: AsyncSession,
         user_id: int,
-        request: ChatRequest
+        request: ChatRequest,
+        trip: Optional[Trip] = None
     ) -> ChatResponse:
         """
         대화 메시지 처리
@@ -225,35 +220,54 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         3. GPT 호출
         4. 변경 사항 적용
         5. 세션 업데이트
-        """
-        # 1. 여행 및 일정 로드
-        trip = await trip_crud.get_trip_by_id(db, request.trip_id, user_id)
-        if not trip:
-            return ChatResponse(
-                session_id=0,
-                response="여행을 찾을 수 없습니다.",
-                needs_confirmation=False
-            )
 
-        # 2. 세션 로드 또는 생성
-        session = await self._get_or_create_session(
-            db, user_id, request.trip_id, request.session_id
+        trip: 호출자가 이미 같은 db 세션으로 조회한 여행(일정 포함)이 있으면 넘겨서 재조회 생략
+        """
+        # 세션 로드/생성은 별도 DB 세션에서 먼저 시작해 여행·장소 조회와 겹쳐 실행
+        # (AsyncSession은 동시 사용 불가 → 채팅 세션은 별도 DB 세션에서 조회)
+        session_task = asyncio.create_task(
+            self._load_chat_session(user_id, request.trip_id, request.session_id)
         )
+        try:
+            # 1. 여행 및 일정 로드
+            if trip is None:
+                trip = await trip_crud.get_trip_by_id(db, request.trip_id, user_id)
+            if not trip:
+                session_task.cancel()
+                return ChatResponse(
+                    session_id=0,
+                    response="여행을 찾을 수 없습니다.",
+                    needs_confirmation=False
+                )
 
-        # 3. 현재 일정 컨텍스트 구성
-        itinerary_context = self._format_itineraries(trip.itineraries)
+            # 2. 요청 내용 기반 관련 장소 조회
+            hints = self._extract_query_hints(request.message)
+            available_places = await self._get_places_by_hints(db, trip, hints)
+        except BaseException:
+            session_task.cancel()
+            raise
 
-        # 4. 요청 내용 기반으로 관련 장소 필터링
-        hints = self._extract_query_hints(request.message)
-        available_places = await self._get_places_by_hints(db, trip, hints)
+        # 3. 세션 로드 결과 합류
+        session = await session_task
+        # 히스토리 저장(새 세션이면 INSERT 포함)은 요청 세션에서 한 번에 커밋
+        db.add(session)
+
+        # 4. 현재 일정/장소 컨텍스트 구성
+        itinerary_context = self._format_itineraries(trip.itineraries)
         places_context = self._format_available_places(available_places)
 
-        # 5. 대화 히스토리 구성
-        messages = [
-            {"role": "system", "content": self.SYSTEM_PROMPT},
-            {"role": "system", "content": f"## 현재 일정\n{itinerary_context}"},
-            {"role": "system", "content": f"## 추가 가능한 장소\n{places_context}"}
-        ]
+        # 5. 메시지 구성: 고정 프롬프트 → 이전 대화 → 요청별 컨텍스트 → 새 메시지
+        # 히스토리는 턴마다 뒤에 덧붙기만 하므로 (고정 프롬프트 + 히스토리)가 다음 턴의 공통 prefix가 되어
+        # OpenAI 프롬프트 캐시 적중 구간이 길어짐. 매 턴 바뀌는 일정/장소 컨텍스트는 맨 뒤에 둔다.
+        messages = [{"role": "system", "content": self.SYSTEM_PROMPT}]
+
+        # 이전 대화 추가 (최근 CHAT_CONTEXT_LIMIT개, 글자 수 예산 내에서)
+        history = session.messages
+        if history:
+            messages.extend(self._trim_history(history))
+
+        messages.append({"role": "system", "content": f"## 현재 일정\n{itinerary_context}"})
+        messages.append({"role": "system", "content": f"## 추가 가능한 장소\n{places_context}"})
 
         # 축제 요청 시 여행 기간 정보 컨텍스트 추가 (GPT가 날짜 범위를 인식하도록)
         if hints.get("has_festival"):
@@ -279,34 +293,46 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
                     "content": f"여행 기간({trip.start_date}~{trip.end_date}) 내 해당 지역에서 진행되는 축제를 찾지 못했습니다."
                 })
 
-        # 이전 대화 추가 (최근 CHAT_CONTEXT_LIMIT개)
-        if session.messages:
-            for msg in session.messages[-CHAT_CONTEXT_LIMIT:]:
-                messages.append(msg)
-
         # 새 메시지 추가
         messages.append({"role": "user", "content": request.message})
 
-        # 6. GPT 호출 (파싱 실패 시 최대 2회 재시도)
-        def _call_gpt():
-            return self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=GPT_CHAT_MAX_TOKENS,
-                temperature=0.5,
-                response_format={"type": "json_object"}
-            )
-
+        # 6. GPT 호출 (응답이 불완전할 때만 1회 재시도)
         result = None
-        for attempt in range(3):
-            gpt_response = await asyncio.to_thread(_call_gpt)
-            result_text = gpt_response.choices[0].message.content
+        applied = None
+        for attempt in range(2):
+            # 스트리밍으로 받으면서 response_message 직전까지(changes 포함)가 파싱되면
+            # 모델이 마지막 response_message를 생성하는 동안 변경 사항을 먼저 적용
+            head_ready = asyncio.get_running_loop().create_future()
+            stream_task = asyncio.create_task(self._stream_reply(messages, head_ready))
+            try:
+                head = await head_ready
+                if head is not None:
+                    applied = await self._apply_changes(
+                        db, user_id, trip, head["changes"], available_places
+                    )
+                result_text = await stream_task
+            except Exception as e:
+                stream_task.cancel()
+                if applied is None:
+                    raise
+                # 변경은 이미 커밋됨 → 여기서 실패시키면 히스토리가 빠지고 재전송 시 중복 적용되므로
+                # 스트림 뒷부분 오류는 기록만 하고 적용한 내용(head) 기준으로 응답
+                logger.warning(f"채팅 GPT 스트림 중단 (변경 사항은 적용됨): {e}", exc_info=e)
+                result_text = ""
+            except BaseException:
+                stream_task.cancel()
+                raise
             parsed = self._parse_response(result_text)
+            if head is not None and parsed.get("changes") != head["changes"]:
+                # 앞부분은 이미 적용됨 → 뒷부분이 잘려 파싱에 실패해도 적용한 내용 기준으로 응답
+                parsed = head
+            # JSON 모드라 문법 오류는 없음 → action_type만 빠졌으면 changes에서 채워 재호출 생략
+            self._fill_action_type(parsed)
             # _parse_response는 실패 시 fallback dict를 반환하므로 action_type으로 판별
             if parsed.get("action_type"):
                 result = parsed
                 break
-            logger.warning(f"채팅 GPT 응답 파싱 불완전 (시도 {attempt + 1}/3)")
+            logger.warning(f"채팅 GPT 응답 파싱 불완전 (시도 {attempt + 1}/2)")
 
         if result is None:
             result = {
@@ -323,9 +349,11 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
 
         if not result.get("needs_confirmation") and result.get("action_type") != "question":
             requested_changes = result.get("changes", [])
-            changes_made, updated_trip, warnings = await self._apply_changes(
-                db, user_id, trip, requested_changes, available_places
-            )
+            if applied is None:
+                applied = await self._apply_changes(
+                    db, user_id, trip, requested_changes, available_places
+                )
+            changes_made, updated_trip, warnings = applied
 
             if changes_made:
                 # 실제 적용된 내용을 구체적인 문장으로 구성
@@ -369,6 +397,96 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
             confirmation_message=result.get("confirmation_question")
         )
 
+    async def _stream_reply(self, messages: list, head_ready: asyncio.Future) -> str:
+        """
+        GPT 응답을 스트리밍으로 받아 전체 본문 반환
+
+        본문에 "response_message" 키가 나오면 그 앞부분을 닫아 파싱해 보고,
+        바로 적용 가능한 변경(확인·되묻기 아님)이면 head_ready에 넘김. 그 외에는 None.
+        """
+        text = ""
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=GPT_CHAT_MAX_TOKENS,
+                temperature=0.5,
+                response_format={"type": "json_object"},
+                prompt_cache_key=self._prompt_cache_key,
+                stream=True
+            )
+            async with stream:
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    # 키가 청크 경계에 걸칠 수 있으므로 직전 일부부터 검색
+                    scan_from = max(0, len(text) - len(_REPLY_TAIL_KEY))
+                    text += delta
+                    if head_ready.done():
+                        continue
+                    idx = text.find(_REPLY_TAIL_KEY, scan_from)
+                    if idx != -1:
+                        head_ready.set_result(self._parse_reply_head(text[:idx]))
+        finally:
+            if not head_ready.done():
+                head_ready.set_result(None)
+        return text
+
+    def _parse_reply_head(self, prefix: str) -> Optional[dict]:
+        """response_message 앞부분만으로 완결된 응답이면 반환 (changes·needs_confirmation이 모두 있어야 함)"""
+        try:
+            head = orjson.loads(prefix.rstrip().rstrip(",") + "}")
+        except orjson.JSONDecodeError:
+            return None
+        if not isinstance(head, dict) or not isinstance(head.get("changes"), list):
+            return None
+        # 필드 순서를 지키지 않아 needs_confirmation이 뒤에 오면 확인 여부를 알 수 없으므로 조기 적용 안 함
+        if "needs_confirmation" not in head or head["needs_confirmation"]:
+            return None
+        self._fill_action_type(head)
+        if not head.get("action_type") or head["action_type"] == "question":
+            return None
+        return head
+
+    @staticmethod
+    def _fill_action_type(parsed: dict) -> None:
+        """action_type이 빠진 응답을 changes의 action으로 보정 (여러 종류면 compound)"""
+        if parsed.get("action_type") or not isinstance(parsed.get("changes"), list):
+            return
+        actions = {c.get("action") for c in parsed["changes"] if isinstance(c, dict)} - {None}
+        if len(actions) == 1:
+            parsed["action_type"] = actions.pop()
+        elif actions:
+            parsed["action_type"] = "compound"
+
+    @staticmethod
+    def _trim_history(history: list) -> list:
+        """최신 메시지부터 CHAT_CONTEXT_LIMIT개·CHAT_CONTEXT_CHAR_BUDGET자 이내로 잘라 반환.
+        가장 최근 메시지는 예산을 넘어도 항상 포함한다.
+        """
+        trimmed = []
+        used = 0
+        for msg in reversed(history[-CHAT_CONTEXT_LIMIT:]):
+            used += len(msg.get("content") or "")
+            if trimmed and used > CHAT_CONTEXT_CHAR_BUDGET:
+                break
+            trimmed.append(msg)
+        trimmed.reverse()
+        return trimmed
+
+    async def _load_chat_session(
+        self,
+        user_id: int,
+        trip_id: int,
+        session_id: Optional[int]
+    ) -> ChatSession:
+        """별도 DB 세션에서 채팅 세션 로드 또는 생성
+        (기존 세션은 detached, 새 세션은 아직 저장 전 상태 → 요청 세션에 add 후 함께 커밋)
+        """
+        async with database.DBSessionLocal() as chat_db:
+            return await self._get_or_create_session(chat_db, user_id, trip_id, session_id)
+
     async def _get_or_create_session(
         self,
         db: AsyncSession,
@@ -381,11 +499,13 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         우선순위:
         1) 명시적 session_id → 해당 세션 반환
         2) session_id 없음 → 같은 trip의 최근 세션 재사용 (대화 맥락 유지)
-        3) 기존 세션 없음 → 새 세션 생성
+        3) 기존 세션 없음 → 새 세션 생성 (커밋하지 않음, _update_session 커밋 때 함께 저장)
         """
         if session_id:
             result = await db.execute(
-                select(ChatSession).where(
+                select(ChatSession)
+                .options(selectinload(ChatSession.message_rows))
+                .where(
                     ChatSession.id == session_id,
                     ChatSession.user_id == user_id
                 )
@@ -397,6 +517,7 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         # session_id가 없거나 찾지 못한 경우 → 같은 trip의 최근 세션 재사용
         result = await db.execute(
             select(ChatSession)
+            .options(selectinload(ChatSession.message_rows))
             .where(
                 ChatSession.user_id == user_id,
                 ChatSession.trip_id == trip_id
@@ -408,17 +529,13 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         if existing:
             return existing
 
-        # 기존 세션 없으면 새로 생성
-        session = ChatSession(
+        # 기존 세션 없으면 새로 생성 (INSERT는 요청 세션의 턴 종료 커밋에 합쳐짐)
+        return ChatSession(
             user_id=user_id,
             trip_id=trip_id,
-            messages=[],
+            message_rows=[],
             current_state="modifying"
         )
-        db.add(session)
-        await db.commit()
-        await db.refresh(session)
-        return session
 
     async def _update_session(
         self,
@@ -428,21 +545,17 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         assistant_response: str,
         changes_made: Optional[list] = None
     ):
-        """세션 히스토리 업데이트.
+        """세션 히스토리 업데이트 (이번 턴의 user/assistant 두 행만 INSERT).
         changes_made가 있으면 assistant 메시지에 실제 변경 결과를 덧붙여
         GPT가 다음 대화에서 실제로 무엇이 바뀌었는지 참조할 수 있게 한다.
         """
         import json as _json
-        from sqlalchemy.orm.attributes import flag_modified
-
-        messages = session.messages or []
-        messages.append({"role": "user", "content": user_message})
 
         if changes_made:
             try:
                 # 변경내역에 datetime/time 객체 등이 섞여 있을 수 있으므로
-                # 안전한 직렬화를 위해 default=str를 사용합니다.
-                result_summary = _json.dumps(changes_made, ensure_ascii=False, default=str)
+                # 안전한 직렬화를 위해 default=str를 사용합니다. (orjson: 공백 없는 출력 → 히스토리 토큰 절약)
+                result_summary = orjson.dumps(changes_made, default=str).decode()
             except Exception:
                 # 최후 방어: 직렬화 실패 시 간단한 텍스트로 대체
                 try:
@@ -456,11 +569,15 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         else:
             full_response = assistant_response
 
-        messages.append({"role": "assistant", "content": full_response})
+        rows = session.message_rows
+        next_seq = rows[-1].seq + 1 if rows else 1
+        rows.append(ChatSessionMessage(seq=next_seq, role="user", content=user_message))
+        rows.append(ChatSessionMessage(seq=next_seq + 1, role="assistant", content=full_response))
 
-        # 최근 CHAT_STORAGE_LIMIT개만 유지
-        session.messages = messages[-CHAT_STORAGE_LIMIT:]
-        flag_modified(session, "messages")
+        # 최근 CHAT_STORAGE_LIMIT개만 유지 (컬렉션에서 빠진 행은 delete-orphan으로 DELETE)
+        excess = len(rows) - CHAT_STORAGE_LIMIT
+        if excess > 0:
+            del rows[:excess]
         await db.commit()
 
     def _build_applied_message(self, changes_made: list) -> str:
@@ -569,7 +686,8 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         lines = []
         current_day = 0
 
-        for it in sorted(itineraries, key=lambda x: (x.day_number, x.order_index)):
+        # Trip.itineraries는 day_number, order_index 순으로 로드되므로 다시 정렬하지 않음
+        for it in itineraries:
             if it.day_number != current_day:
                 current_day = it.day_number
                 lines.append(f"\n### {current_day}일차")
@@ -584,26 +702,14 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         return '\n'.join(lines)
 
     def _extract_query_hints(self, message: str) -> dict:
-        """사용자 메시지에서 카테고리 힌트 추출 (GPT 없이 키워드 매칭)"""
-        CATEGORY_MAP = {
-            "카페": ["카페", "커피", "디저트", "베이커리", "브런치"],
-            "맛집": ["맛집", "식당", "음식", "밥", "점심", "저녁", "먹을", "레스토랑",
-                    "고기", "해산물", "국밥", "냉면", "분식", "피자", "치킨"],
-            "관광지": ["관광지", "명소", "관광", "여행지", "볼거리", "경치", "뷰"],
-            "문화시설": ["박물관", "미술관", "전시", "문화", "공연", "갤러리", "역사"],
-            "자연": ["공원", "산", "바다", "해변", "해수욕장", "자연", "트레킹", "등산", "숲"],
-            "쇼핑": ["쇼핑", "마트", "시장", "백화점", "쇼핑몰", "면세점"],
-            "체험": ["체험", "액티비티", "놀이", "테마파크", "워터파크"],
-        }
+        """사용자 메시지에서 카테고리 힌트 추출 (GPT 없이 키워드 매칭, 정규식 한 번으로 스캔)"""
+        matched = {_HINT_KEYWORD_CATEGORY[kw] for kw in _HINT_KEYWORD_RE.findall(message)}
 
-        found = []
-        for cat, keywords in CATEGORY_MAP.items():
-            if any(kw in message for kw in keywords):
-                found.append(cat)
+        # _CATEGORY_KEYWORDS 순서 유지 (앞 카테고리부터 조회)
+        found = [cat for cat in _CATEGORY_KEYWORDS if cat in matched]
 
         # 축제 요청 감지 (별도 플래그)
-        festival_keywords = ["축제", "페스티벌", "festival", "행사", "이벤트"]
-        has_festival = any(kw in message for kw in festival_keywords)
+        has_festival = _FESTIVAL_HINT in matched
 
         return {"categories": found, "has_festival": has_festival}
 
@@ -614,8 +720,6 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         hints: dict
     ) -> List[Place]:
         """요청 힌트 기반으로 관련 장소 인기순 조회"""
-        from sqlalchemy import nulls_last
-
         categories = hints.get("categories", [])
         collected: List[Place] = []
         seen_ids: set = set()
@@ -630,25 +734,80 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
                     collected.append(p)
                     seen_ids.add(p.id)
 
+        # 지역·카테고리 기준 후보 장소 (60초 캐시, 축제는 매번 조회)
+        for p in await self._get_cached_region_places(db, search_region, categories):
+            if p.id not in seen_ids:
+                collected.append(p)
+                seen_ids.add(p.id)
+
+        return collected
+
+    async def _get_cached_region_places(
+        self,
+        db: AsyncSession,
+        search_region: Optional[str],
+        categories: List[str]
+    ) -> List[Place]:
+        """지역·카테고리 기준 후보 장소 조회 (place_id 목록을 짧게 캐시)"""
+        region_key = tuple(search_region) if isinstance(search_region, list) else search_region
+        cache_key = (region_key, tuple(sorted(categories)))
+        cached = self._places_cache.get(cache_key)
+        if cached:
+            ts, place_ids = cached
+            if time.time() - ts < self._places_cache_ttl:
+                if not place_ids:
+                    return []
+                result = await db.execute(select(Place).where(Place.id.in_(place_ids)))
+                by_id = {p.id: p for p in result.scalars().all()}
+                return [by_id[pid] for pid in place_ids if pid in by_id]
+            self._places_cache.pop(cache_key, None)
+
+        places = await self._query_region_places(db, search_region, categories)
+
+        self._places_cache[cache_key] = (time.time(), [p.id for p in places])
+        while len(self._places_cache) > self._places_cache_maxsize:
+            # dict는 삽입 순서를 유지하므로 첫 항목이 가장 오래된 항목
+            self._places_cache.pop(next(iter(self._places_cache)))
+        return places
+
+    async def _query_region_places(
+        self,
+        db: AsyncSession,
+        search_region: Optional[str],
+        categories: List[str]
+    ) -> List[Place]:
+        """카테고리 우선 + 전체 인기순 보완으로 후보 장소 조회"""
+        from sqlalchemy import nulls_last
+
+        collected: List[Place] = []
+        seen_ids: set = set()
+
         # 힌트 카테고리가 있으면 해당 카테고리 위주로 조회 (카테고리당 20개 → 토큰 절약)
+        # 카테고리별 상위 20개를 ROW_NUMBER 윈도 함수로 한 번에 조회 (카테고리 수만큼 왕복하지 않음)
         if categories:
-            from sqlalchemy import cast, Text
+            from sqlalchemy import cast, func, Text
+            ranked = select(
+                Place.id,
+                func.row_number().over(
+                    partition_by=Place.category,
+                    order_by=nulls_last(Place.readcount.desc())
+                ).label("rn")
+            ).where(Place.category.in_(categories))
+            if search_region:
+                ranked = ranked.where(Place.address.contains(search_region))
+            ranked = ranked.subquery()
+            result = await db.execute(
+                select(Place)
+                .join(ranked, Place.id == ranked.c.id)
+                .where(ranked.c.rn <= 20)
+                .order_by(ranked.c.rn)
+            )
+            by_category: Dict[str, List[Place]] = {cat: [] for cat in categories}
+            for p in result.scalars().all():
+                by_category[p.category].append(p)
+
             for cat in categories:
-                query = select(Place)
-                if search_region:
-                    query = query.where(Place.address.contains(search_region))
-                query = (
-                    query
-                    .where(Place.category == cat)
-                    .order_by(nulls_last(Place.readcount.desc()))
-                    .limit(20)
-                )
-                result = await db.execute(query)
-                cat_places = result.scalars().all()
-                for p in cat_places:
-                    if p.id not in seen_ids:
-                        collected.append(p)
-                        seen_ids.add(p.id)
+                cat_places = by_category[cat]
 
                 # DB에 해당 카테고리가 없으면 (카페, 쇼핑 등) 태그 텍스트로 폴백
                 if not cat_places:
@@ -662,10 +821,12 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
                         .limit(20)
                     )
                     result = await db.execute(tag_q)
-                    for p in result.scalars().all():
-                        if p.id not in seen_ids:
-                            collected.append(p)
-                            seen_ids.add(p.id)
+                    cat_places = result.scalars().all()
+
+                for p in cat_places:
+                    if p.id not in seen_ids:
+                        collected.append(p)
+                        seen_ids.add(p.id)
 
         # 힌트가 없거나 결과 부족 시 전체 인기순으로 보완 (최대 50개 → 토큰 절약)
         if len(collected) < 30:
@@ -706,22 +867,29 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
                 end_date=trip.end_date,
                 max_items=20
             )
-            result = await festival_service.search_festivals(db, search_req, fetch_detail=False)
+            result = await festival_service.search_festivals(search_req, fetch_detail=False)
             if not result.get("success"):
                 return []
 
             festivals = result.get("festivals", [])
-            places: List[Place] = []
+            if not festivals:
+                return []
+
+            # 상세 조회는 동시에, 중복 확인/저장은 일괄 처리
+            place_ids = await festival_service.save_festivals_as_places(db, [f.id for f in festivals])
+            if not place_ids:
+                return []
 
+            place_result = await db.execute(select(Place).where(Place.id.in_(set(place_ids.values()))))
+            place_by_id = {p.id: p for p in place_result.scalars().all()}
+
+            places: List[Place] = []
+            seen: set = set()
             for festival in festivals:
-                try:
-                    place_id = await festival_service.save_festival_as_place(db, festival.id)
-                    place_result = await db.execute(select(Place).where(Place.id == place_id))
-                    place = place_result.scalar_one_or_none()
-                    if place:
-                        places.append(place)
-                except Exception as e:
-                    logger.warning(f"축제 Place 저장 실패 (id={festival.id}): {e}")
+                place = place_by_id.get(place_ids.get(festival.id))
+                if place and place.id not in seen:
+                    places.append(place)
+                    seen.add(place.id)
 
             return places
 
@@ -745,22 +913,15 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         return '\n'.join(lines)
 
     def _parse_response(self, text: str) -> dict:
-        """GPT 응답 파싱"""
-        text = text.strip()
-
-        # 코드 블록 제거
-        if text.startswith("```"):
-            text = re.sub(r'^```(?:json)?\n?', '', text)
-            text = re.sub(r'\n?```$', '', text)
-
+        """GPT 응답 파싱 (JSON 모드이므로 바로 파싱, 실패 시에만 본문에서 JSON 객체 추출)"""
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            match = re.search(r'\{[\s\S]*\}', text)
+            return orjson.loads(text)
+        except (orjson.JSONDecodeError, TypeError):
+            match = _JSON_OBJECT_RE.search(text or "")
             if match:
                 try:
-                    return json.loads(match.group())
-                except json.JSONDecodeError:
+                    return orjson.loads(match.group())
+                except orjson.JSONDecodeError:
                     pass
 
             # 파싱 실패 시 기본 응답 (원문 text는 JSON 코드일 수 있으므로 사용자에게 노출 금지)
@@ -771,6 +932,22 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
                 "needs_confirmation": False
             }
 
+    @staticmethod
+    def _name_match_query(name: str):
+        """
+        장소명 포함 매칭 1건 조회 쿼리 (정확히 같은 이름 우선, 그 다음 인기순)
+
+        대소문자 무시 부분 일치(ILIKE '%name%')는 ix_places_name_trgm(pg_trgm GIN) 인덱스를 사용한다.
+        """
+        from sqlalchemy import nulls_last
+
+        return (
+            select(Place)
+            .where(Place.name.icontains(name, autoescape=True))
+            .order_by((Place.name == name).desc(), nulls_last(Place.readcount.desc()))
+            .limit(1)
+        )
+
     async def _search_place_in_db(
         self,
         db: AsyncSession,
@@ -792,8 +969,8 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
 
         search_region = REGION_PREFIX.get(region, region) if region else None
 
-        # 1. 정확 매칭 (지역 필터 포함)
-        q = select(Place).where(Place.name == name)
+        # 1~2. 정확 매칭 우선, 없으면 포함 매칭 인기순 (지역 필터 포함, 쿼리 1회)
+        q = self._name_match_query(name)
         if search_region:
             q = q.where(Place.address.contains(search_region))
         result = await db.execute(q)
@@ -801,23 +978,8 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         if place:
             return place
 
-        # 2. 포함 매칭 (지역 필터 포함, 인기순)
-        q = select(Place).where(Place.name.contains(name))
-        if search_region:
-            q = q.where(Place.address.contains(search_region))
-        q = q.order_by(nulls_last(Place.readcount.desc())).limit(1)
-        result = await db.execute(q)
-        place = result.scalar_one_or_none()
-        if place:
-            return place
-
         # 3. 포함 매칭 (지역 필터 없이 재시도 — 지역 표기가 달라도 찾을 수 있도록)
-        q = (
-            select(Place)
-            .where(Place.name.contains(name))
-            .order_by(nulls_last(Place.readcount.desc()))
-            .limit(1)
-        )
+        q = self._name_match_query(name)
         result = await db.execute(q)
         place = result.scalar_one_or_none()
         if place:
@@ -878,16 +1040,8 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
                 return q.where(Place.address.contains(search_region))
             return q
 
-        # 1. 정확 매칭
-        q = apply_region(select(Place).where(Place.name == name))
-        result = await db.execute(q)
-        place = result.scalar_one_or_none()
-        if place:
-            return place
-
-        # 2. 포함 매칭 (readcount 정렬)
-        q = apply_region(select(Place).where(Place.name.contains(name)))
-        q = q.order_by(nulls_last(Place.readcount.desc())).limit(1)
+        # 1~2. 정확 매칭 우선, 없으면 포함 매칭 인기순 (쿼리 1회)
+        q = apply_region(self._name_match_query(name))
         result = await db.execute(q)
         place = result.scalar_one_or_none()
         if place:
@@ -923,29 +1077,41 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
 
         return None  # 지역 내 미발견 → None (다른 지역 장소 반환 안 함)
 
+    @staticmethod
+    def _build_name_index(places: List[Place]) -> Dict[str, Place]:
+        """소문자 장소명 → Place 인덱스 (같은 이름이면 앞쪽 장소 우선)"""
+        index: Dict[str, Place] = {}
+        for p in places:
+            index.setdefault(p.name.lower(), p)
+        return index
+
     def _find_place_by_name(
         self,
         name: str,
-        places: List[Place]
+        places: List[Place],
+        name_index: Optional[Dict[str, Place]] = None
     ) -> Optional[Place]:
         """장소명으로 매칭 (정확 → 포함 → 토큰 교집합 순으로 폴백)
         available_places 리스트 안에서만 검색. DB 전체 검색은 _search_place_in_db 사용.
+        name_index(_build_name_index 결과)를 넘기면 요청 내 여러 번의 조회가 인덱스를 공유한다.
         """
         if not name:
             return None
 
         name_lower = name.lower().strip()
+        if name_index is None:
+            name_index = self._build_name_index(places)
 
-        # 1. 정확 매칭
-        for p in places:
-            if p.name.lower() == name_lower:
-                return p
+        # 1. 정확 매칭 (dict 조회)
+        exact = name_index.get(name_lower)
+        if exact:
+            return exact
 
         # 2. 포함 매칭 (이름 길이 차이가 가장 작은 것 선택)
+        lowered = name_index.items()
         best_match = None
         best_len_diff = float('inf')
-        for p in places:
-            pname = p.name.lower()
+        for pname, p in lowered:
             if name_lower in pname or pname in name_lower:
                 diff = abs(len(pname) - len(name_lower))
                 if diff < best_len_diff:
@@ -957,12 +1123,11 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
 
         # 3. 토큰 교집합 매칭 (예: "감천마을" → "감천문화마을" 매칭)
         # 2글자 이상 한글 단어를 토큰으로 분리하여 교집합이 가장 큰 장소 선택
-        import re as _re
-        query_tokens = set(_re.findall(r'[가-힣]{2,}', name_lower))
+        query_tokens = set(_HANGUL_TOKEN_RE.findall(name_lower))
         if query_tokens:
             best_score = 0
-            for p in places:
-                place_tokens = set(_re.findall(r'[가-힣]{2,}', p.name.lower()))
+            for pname, p in lowered:
+                place_tokens = set(_HANGUL_TOKEN_RE.findall(pname))
                 intersection = query_tokens & place_tokens
                 score = len(intersection) / max(len(query_tokens), 1)
                 if score > best_score and score >= 0.5:
@@ -1056,6 +1221,20 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
 
         return None
 
+    def _find_target_itinerary(
+        self,
+        change: dict,
+        itineraries: List[Itinerary],
+        name_key: str = "place_name"
+    ) -> Optional[Itinerary]:
+        """change의 itinerary_id(IID)로 먼저 찾고, 없으면 장소명(name_key)으로 매칭"""
+        iid = change.get("itinerary_id")
+        if iid is not None:
+            for it in itineraries:
+                if it.id == iid:
+                    return it
+        return self._find_itinerary_by_name(change.get(name_key, ""), itineraries)
+
     def _find_itinerary_by_name(
         self,
         name: str,
@@ -1066,17 +1245,14 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
             return None
 
         name_lower = name.lower().strip()
+        lowered = [(it.place.name.lower(), it) for it in itineraries]
 
-        # 1. 정확 매칭
-        for it in itineraries:
-            if it.place.name.lower() == name_lower:
-                return it
-
-        # 2. 포함 매칭
+        # 1. 정확 매칭 / 2. 포함 매칭 (한 번의 순회로 처리, 정확 매칭이면 즉시 반환)
         best_match = None
         best_len_diff = float('inf')
-        for it in itineraries:
-            pname = it.place.name.lower()
+        for pname, it in lowered:
+            if pname == name_lower:
+                return it
             if name_lower in pname or pname in name_lower:
                 diff = abs(len(pname) - len(name_lower))
                 if diff < best_len_diff:
@@ -1087,12 +1263,11 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
             return best_match
 
         # 3. 토큰 교집합 매칭 (예: "감천마을" → "감천문화마을")
-        import re as _re
-        query_tokens = set(_re.findall(r'[가-힣]{2,}', name_lower))
+        query_tokens = set(_HANGUL_TOKEN_RE.findall(name_lower))
         if query_tokens:
             best_score = 0
-            for it in itineraries:
-                place_tokens = set(_re.findall(r'[가-힣]{2,}', it.place.name.lower()))
+            for pname, it in lowered:
+                place_tokens = set(_HANGUL_TOKEN_RE.findall(pname))
                 intersection = query_tokens & place_tokens
                 score = len(intersection) / max(len(query_tokens), 1)
                 if score > best_score and score >= 0.5:
@@ -1113,13 +1288,18 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         applied_changes = []
         warning_messages = []
         place_id_dict = {p.id: p for p in available_places}
+        # available_places는 요청 동안 바뀌지 않으므로 이름 인덱스도 한 번만 생성
+        # (trip.itineraries는 변경마다 바뀌므로 _find_itinerary_by_name은 매번 조회)
+        place_name_index = self._build_name_index(available_places)
 
         for change in changes:
             action = change.get("action")
 
             try:
                 if action == "add":
-                    result = await self._apply_add(db, trip, change, available_places, place_id_dict)
+                    result = await self._apply_add(
+                        db, trip, change, available_places, place_id_dict, place_name_index
+                    )
                     if result:
                         applied_changes.append(result)
 
@@ -1129,7 +1309,9 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
                         applied_changes.append(result)
 
                 elif action == "replace":
-                    result = await self._apply_replace(db, trip, change, available_places, place_id_dict)
+                    result = await self._apply_replace(
+                        db, trip, change, available_places, place_id_dict, place_name_index
+                    )
                     if result:
                         if result.get("_blocked"):
                             warning_messages.append(result["_blocked"])
@@ -1179,41 +1361,37 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
             except Exception as e:
                 logger.error(f"변경 사항 적용 실패 ({action}): {e}")
 
-        # 업데이트된 여행 정보 조회 (user_id 포함하여 보안 유지)
-        updated = await trip_crud.get_trip_by_id(db, trip.id, user_id)
-
-        trip_dict = None
-        if updated:
-            trip_dict = {
-                "id": updated.id,
-                "title": updated.title,
-                "region": updated.region,
-                "start_date": str(updated.start_date),
-                "end_date": str(updated.end_date),
-                "itineraries": [
-                    {
-                        "id": it.id,
-                        "place_id": it.place_id,
-                        "place_name": it.place.name,
-                        "place_category": it.place.category,
-                        "place_address": it.place.address,
-                        "latitude": it.place.latitude,
-                        "longitude": it.place.longitude,
-                        "image_url": it.place.image_url,
-                        "day_number": it.day_number,
-                        "order_index": it.order_index,
-                        "arrival_time": it.arrival_time.strftime("%H:%M") if it.arrival_time else None,
-                        "stay_duration": it.stay_duration,
-                        "travel_time_from_prev": it.travel_time_from_prev,
-                        "transport_mode": it.transport_mode,
-                        "memo": it.memo,
-                    }
-                    for it in sorted(
-                        updated.itineraries,
-                        key=lambda x: (x.day_number, x.order_index)
-                    )
-                ]
-            }
+        # 응답용 일정만 다시 조회 (소유권은 process_message에서 확인됨, 여행 행은 세션의 trip 재사용)
+        # trip.itineraries 컬렉션은 변경 적용 중 추가/삭제된 항목을 반영하지 않으므로 사용하지 않음
+        itineraries = await trip_crud.get_itineraries_by_trip(db, trip.id)
+
+        trip_dict = {
+            "id": trip.id,
+            "title": trip.title,
+            "region": trip.region,
+            "start_date": str(trip.start_date),
+            "end_date": str(trip.end_date),
+            "itineraries": [
+                {
+                    "id": it.id,
+                    "place_id": it.place_id,
+                    "place_name": it.place.name,
+                    "place_category": it.place.category,
+                    "place_address": it.place.address,
+                    "latitude": it.place.latitude,
+                    "longitude": it.place.longitude,
+                    "image_url": it.place.image_url,
+                    "day_number": it.day_number,
+                    "order_index": it.order_index,
+                    "arrival_time": it.arrival_time.strftime("%H:%M") if it.arrival_time else None,
+                    "stay_duration": it.stay_duration,
+                    "travel_time_from_prev": it.travel_time_from_prev,
+                    "transport_mode": it.transport_mode,
+                    "memo": it.memo,
+                }
+                for it in itineraries  # day_number, order_index 순으로 조회됨
+            ]
+        }
 
         return applied_changes, trip_dict, warning_messages
 
@@ -1240,10 +1418,9 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         return self.CATEGORY_DEFAULT_MINUTES.get(category, 10 * 60)
 
     async def _apply_add(
-        self, db, trip, change, available_places, place_id_dict
+        self, db, trip, change, available_places, place_id_dict, place_name_index=None
     ) -> Optional[dict]:
         """장소 추가 — 카테고리/시간 기반으로 적절한 위치에 삽입 후 시간 재계산"""
-        from Trip.dto import ItineraryCreate, ItineraryUpdate
         from sqlalchemy import select as sa_select
         from collections import Counter
         from core.models import Itinerary as ItineraryModel
@@ -1253,16 +1430,14 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
             sa_select(ItineraryModel.place_id).where(ItineraryModel.trip_id == trip.id)
         )
         existing_ids = {row[0] for row in _cur.fetchall()}
-        place = None
+        # place_id로 직접 매핑 (가장 정확, 이름 매칭·DB 검색 생략)
+        place = place_id_dict.get(change["place_id"]) if change.get("place_id") else None
 
-        if change.get("place_name"):
-            place = self._find_place_by_name(change["place_name"], available_places)
+        if not place and change.get("place_name"):
+            place = self._find_place_by_name(change["place_name"], available_places, place_name_index)
             if not place:
                 place = await self._search_place_in_db(db, change["place_name"], trip.region)
 
-        if not place and change.get("place_id"):
-            place = place_id_dict.get(change["place_id"])
-
         if not place and change.get("category"):
             cat = change["category"]
             for p in available_places:
@@ -1278,12 +1453,9 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
                 if search_region:
                     q = q.where(PlaceModel.address.contains(search_region))
                 q = q.where(~PlaceModel.id.in_(existing_ids))
-                q = q.order_by(nulls_last(PlaceModel.readcount.desc())).limit(10)
+                q = q.order_by(nulls_last(PlaceModel.readcount.desc())).limit(1)
                 result = await db.execute(q)
-                for p in result.scalars().all():
-                    if p.id not in existing_ids:
-                        place = p
-                        break
+                place = result.scalar_one_or_none()
             # 카테고리 이름이 DB에 없는 경우 (예: "카페", "쇼핑") → tags 텍스트 검색
             if not place:
                 from sqlalchemy import nulls_last, cast, Text
@@ -1297,13 +1469,10 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
                     .where(cast(PlaceModel.tags, Text).contains(f'"{cat}"'))
                     .where(~PlaceModel.id.in_(existing_ids))
                     .order_by(nulls_last(PlaceModel.readcount.desc()))
-                    .limit(10)
+                    .limit(1)
                 )
                 result = await db.execute(tag_q)
-                for p in result.scalars().all():
-                    if p.id not in existing_ids:
-                        place = p
-                        break
+                place = result.scalar_one_or_none()
 
         # 태그 기반 검색 (카테고리로도 못 찾은 경우)
         # GPT가 "야경", "포토스팟", "힐링" 등 속성 기반으로 요청할 때 사용
@@ -1391,9 +1560,10 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         start_h = first_orig_time.hour if first_orig_time else 9
         start_m = first_orig_time.minute if first_orig_time else 0
 
-        # order_index 재정렬
+        # order_index 재정렬 (변경분은 커밋 1회로 일괄 반영)
         for idx, it in enumerate(ordered, start=1):
-            await trip_crud.update_itinerary(db, it.id, ItineraryUpdate(order_index=idx))
+            it.order_index = idx
+        await db.commit()
 
         # 업데이트 후 ORM 객체 expire됨 → DB에서 재조회 후 시간 재계산
         from sqlalchemy.orm import selectinload as _selectinload
@@ -1441,9 +1611,7 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
 
     async def _apply_remove(self, db, trip, change, available_places: list = None) -> Optional[dict]:
         """장소 제거 후 같은 일차 order_index 재정렬 + 빈 자리 자동 보충"""
-        target = self._find_itinerary_by_name(
-            change.get("place_name", ""), trip.itineraries
-        )
+        target = self._find_target_itinerary(change, trip.itineraries)
         if not target:
             return None
 
@@ -1460,7 +1628,6 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         trip_id = trip.id
         trip_region = trip.region
 
-        from Trip.dto import ItineraryUpdate, ItineraryCreate
         from sqlalchemy import select as sa_select
         from core.models import Itinerary as ItineraryModel
 
@@ -1540,10 +1707,11 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
             start_h = first_time.hour if first_time else 9
             start_m = first_time.minute if first_time else 0
 
-        # order_index 재정렬
+        # order_index 재정렬 (변경분은 커밋 1회로 일괄 반영)
         for idx, it in enumerate(remaining, start=1):
             if it.order_index != idx:
-                await trip_crud.update_itinerary(db, it.id, ItineraryUpdate(order_index=idx))
+                it.order_index = idx
+        await db.commit()
 
         # 재조회 후 시간 재계산 (place 포함 eager load 필수 — lazy load는 async에서 실패)
         from sqlalchemy.orm import selectinload as _selectinload
@@ -1620,7 +1788,7 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         return result.scalar_one_or_none()
 
     async def _apply_replace(
-        self, db, trip, change, available_places, place_id_dict
+        self, db, trip, change, available_places, place_id_dict, place_name_index=None
     ) -> Optional[dict]:
         """장소 교체 (source_place_id / target_search_keyword 지원)"""
         # 커밋 전에 미리 추출 (이후 trip.itineraries expire 방지)
@@ -1653,13 +1821,15 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
                     break
 
         # ── 넣을 장소(new) 찾기 — 반드시 같은 지역 내에서만 ──
-        new_place = None
         region = trip.region  # 지역 미리 추출
 
+        # place_id로 직접 매핑 (가장 정확, available_places = 지역 필터됨)
+        new_place = place_id_dict.get(change["place_id"]) if change.get("place_id") else None
+
         # target_search_keyword: available_places 우선, DB 폴백은 지역 필터 강제
-        if change.get("target_search_keyword"):
+        if not new_place and change.get("target_search_keyword"):
             new_place = self._find_place_by_name(
-                change["target_search_keyword"], available_places
+                change["target_search_keyword"], available_places, place_name_index
             )
             if not new_place:
                 new_place = await self._search_place_in_db_strict(
@@ -1669,17 +1839,13 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         # new_place 이름으로 폴백
         if not new_place and change.get("new_place"):
             new_place = self._find_place_by_name(
-                change["new_place"], available_places
+                change["new_place"], available_places, place_name_index
             )
             if not new_place:
                 new_place = await self._search_place_in_db_strict(
                     db, change["new_place"], region
                 )
 
-        # place_id로 직접 매핑
-        if not new_place and change.get("place_id"):
-            new_place = place_id_dict.get(change["place_id"])
-
         # target_category로 폴백 (카테고리 내 첫 번째 미사용 장소, available_places = 지역 필터됨)
         # 이름 검색이 실패한 경우에도 같은 카테고리로 자동 대체
         if not new_place:
@@ -1695,7 +1861,6 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
             already_used = {it.place_id for it in itineraries_snapshot if it.id != old_it.id}
             if new_place.id in already_used:
                 return {"_blocked": f"'{new_place.name}'은(는) 이미 다른 날 일정에 포함되어 있어 교체할 수 없습니다. 원하시는 식당 이름을 직접 말씀해 주세요"}
-            from Trip.dto import ItineraryUpdate
             await trip_crud.update_itinerary(
                 db, old_it.id,
                 ItineraryUpdate(place_id=new_place.id)
@@ -1718,13 +1883,10 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
     async def _apply_reorder(self, db, trip, change, available_places: list = None) -> Optional[dict]:
         """순서 변경 / 다른 일차로 이동 후 관련 일차 전체 order_index + arrival_time 재정렬
         다른 날로 이동 시 출발 일차에 빈 자리 자동 보충"""
-        from Trip.dto import ItineraryUpdate, ItineraryCreate
         from sqlalchemy import select as sa_select
         from core.models import Itinerary as ItineraryModel
 
-        target = self._find_itinerary_by_name(
-            change.get("place_name", ""), trip.itineraries
-        )
+        target = self._find_target_itinerary(change, trip.itineraries)
         if not target:
             return None
 
@@ -1814,21 +1976,13 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
                 start_h = first_time.hour if first_time else 9
                 start_m = first_time.minute if first_time else 0
 
-            # order_index 정리
+            # order_index 정리 (세션 객체에만 반영 → 시간 재계산의 커밋에서 시간 변경분과 함께 한 번에 UPDATE)
             for idx, it in enumerate(ordered, start=1):
                 if it.order_index != idx:
-                    await trip_crud.update_itinerary(db, it.id, ItineraryUpdate(order_index=idx))
+                    it.order_index = idx
 
-            # 재조회 후 시간 재계산 (place eager load 필수)
-            from sqlalchemy.orm import selectinload as _selectinload
-            result_fresh = await db.execute(
-                sa_select(ItineraryModel)
-                .options(_selectinload(ItineraryModel.place))
-                .where(ItineraryModel.trip_id == trip_id, ItineraryModel.day_number == day)
-                .order_by(ItineraryModel.order_index, ItineraryModel.id)
-            )
-            fresh_day = list(result_fresh.scalars().all())
-            await self._recalculate_day_times(db, fresh_day, start_hour=start_h, start_minute=start_m)
+            # ordered는 이 일차의 전체 행(place eager load 완료)을 새 순서대로 담고 있으므로 재조회 없이 바로 시간 재계산
+            await self._recalculate_day_times(db, ordered, start_hour=start_h, start_minute=start_m)
 
         return {
             "action": "reorder",
@@ -1893,7 +2047,6 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         from datetime import time as time_type
         from sqlalchemy import delete as sa_delete, select as sa_select
         from core.models import Itinerary as ItineraryModel
-        from Trip.dto import ItineraryUpdate
         from services.kakao_service import get_route_info
         from Planner.constants import LUNCH_START, LUNCH_END, EARLY_DINNER_START, NIGHT_START
         from Planner.time_constraint import get_time_constraint_service
@@ -2022,22 +2175,22 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
             if h >= 24:
                 h, m = 23, 59
 
-            update_fields = {"arrival_time": time_type(h, m)}
+            # 세션에 로드된 객체에 바로 반영 (루프 종료 후 커밋 1회로 일괄 UPDATE)
+            it = ordered_itineraries[i]
+            it.arrival_time = time_type(h, m)
             if not is_first_kept:
-                update_fields["travel_time_from_prev"] = travel
-
-            await trip_crud.update_itinerary(db, it_id, ItineraryUpdate(**update_fields))
+                it.travel_time_from_prev = travel
 
             prev_valid_place   = place
             prev_valid_minutes = arrival_minutes + stays[i] + pace_buffer
             is_first_kept      = False
 
-        # 제외 장소 삭제
+        # 제외 장소 삭제 + 시간 변경분 커밋
         if to_delete_ids:
             await db.execute(
                 sa_delete(ItineraryModel).where(ItineraryModel.id.in_(to_delete_ids))
             )
-            await db.commit()
+        await db.commit()
 
         # ── order_index를 arrival_time 순서에 맞게 재정렬 ──────────────────
         # _recalculate_day_times는 arrival_time만 업데이트하므로
@@ -2055,32 +2208,27 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
             day_num_val  = getattr(first_it, 'day_number', None)
             if trip_id_val and day_num_val:
                 result_ord = await db.execute(
-                    sa_select(ItineraryModel.id, ItineraryModel.arrival_time)
+                    sa_select(ItineraryModel)
                     .where(
                         ItineraryModel.trip_id == trip_id_val,
                         ItineraryModel.day_number == day_num_val
                     )
                     .order_by(ItineraryModel.arrival_time.nullsfirst(), ItineraryModel.id)
                 )
-                sorted_ids = [row[0] for row in result_ord.fetchall()]
-                for new_idx, sid in enumerate(sorted_ids, start=1):
-                    await trip_crud.update_itinerary(
-                        db, sid, ItineraryUpdate(order_index=new_idx)
-                    )
-                if sorted_ids:
+                sorted_its = result_ord.scalars().all()
+                for new_idx, sit in enumerate(sorted_its, start=1):
+                    sit.order_index = new_idx
+                if sorted_its:
                     await db.commit()
 
         return messages
 
     async def _apply_modify(self, db, trip, change) -> Optional[dict]:
         """시간/메모 수정"""
-        target = self._find_itinerary_by_name(
-            change.get("place_name", ""), trip.itineraries
-        )
+        target = self._find_target_itinerary(change, trip.itineraries)
         if not target:
             return None
 
-        from Trip.dto import ItineraryUpdate
         from sqlalchemy import select as sa_select
         from core.models import Itinerary as ItineraryModel
 
@@ -2313,8 +2461,6 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         if not it_a or not it_b or it_a.id == it_b.id:
             return None
 
-        from Trip.dto import ItineraryUpdate
-
         order_a = it_a.order_index
         order_b = it_b.order_index
         day_a = it_a.day_number
@@ -2394,25 +2540,19 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         if not day_a or not day_b or day_a == day_b:
             return None
 
-        from Trip.dto import ItineraryUpdate
+        # 루프 중 in-memory day_number 변경이 꼬이지 않도록 대상 목록을 미리 수집
+        day_a_its = [it for it in trip.itineraries if it.day_number == day_a]
+        day_b_its = [it for it in trip.itineraries if it.day_number == day_b]
 
-        TEMP_DAY = 9999
-
-        # 루프 중 in-memory day_number 변경이 꼬이지 않도록 ID만 미리 수집
-        day_a_ids = [it.id for it in trip.itineraries if it.day_number == day_a]
-        day_b_ids = [it.id for it in trip.itineraries if it.day_number == day_b]
-
-        if not day_a_ids or not day_b_ids:
+        if not day_a_its or not day_b_its:
             return None
 
-        for iid in day_a_ids:
-            await trip_crud.update_itinerary(db, iid, ItineraryUpdate(day_number=TEMP_DAY))
-
-        for iid in day_b_ids:
-            await trip_crud.update_itinerary(db, iid, ItineraryUpdate(day_number=day_a))
-
-        for iid in day_a_ids:
-            await trip_crud.update_itinerary(db, iid, ItineraryUpdate(day_number=day_b))
+        # 두 일차 교환은 커밋 1회로 일괄 반영 (day_number에는 유니크 제약이 없어 임시 일차 불필요)
+        for it in day_a_its:
+            it.day_number = day_b
+        for it in day_b_its:
+            it.day_number = day_a
+        await db.commit()
 
         # 두 일차 모두 arrival_time 재계산 (교환 후 시간 순서 정렬)
         all_its = await trip_crud.get_itineraries_by_trip(db, trip.id)
@@ -2568,7 +2708,6 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
           stay_duration_delta: int|null — 현재 체류시간에 더할 분수 (음수=축소)
           start_time_shift: int|null — 첫 장소 도착 시간을 N분 앞당기거나 뒤로 밀기
         """
-        from Trip.dto import ItineraryUpdate
         from sqlalchemy import select as sa_select
         from sqlalchemy.orm import selectinload as _selectinload
         from core.models import Itinerary as ItineraryModel
@@ -2601,17 +2740,17 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
 
         modified_count = 0
 
-        # stay_duration 변경
+        # stay_duration 변경 (변경분은 커밋 1회로 일괄 반영)
         for it in targets:
-            update_fields = {}
             if stay_fixed is not None:
-                update_fields["stay_duration"] = max(10, min(stay_fixed, 480))
+                it.stay_duration = max(10, min(stay_fixed, 480))
+                modified_count += 1
             elif stay_delta is not None:
                 current = it.stay_duration or 60
-                update_fields["stay_duration"] = max(10, min(current + stay_delta, 480))
-            if update_fields:
-                await trip_crud.update_itinerary(db, it.id, ItineraryUpdate(**update_fields))
+                it.stay_duration = max(10, min(current + stay_delta, 480))
                 modified_count += 1
+        if modified_count:
+            await db.commit()
 
         # start_time_shift: 영향받는 일차들의 첫 장소 시간을 이동 후 연쇄 재계산
         if time_shift is not None:
@@ -2667,7 +2806,6 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
     ) -> Optional[dict]:
         """현재 장소 유지 + 동선만 최적화"""
         from Planner.route_optimizer import get_route_optimizer
-        from Trip.dto import ItineraryReorderItem
 
         if not trip.itineraries:
             return None
@@ -2742,7 +2880,9 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
     ) -> Optional[ChatSession]:
         """대화 히스토리 조회 (session_id 기반)"""
         result = await db.execute(
-            select(ChatSession).where(
+            select(ChatSession)
+            .options(selectinload(ChatSession.message_rows))
+            .where(
                 ChatSession.id == session_id,
                 ChatSession.user_id == user_id
             )
@@ -2761,6 +2901,7 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
         """
         result = await db.execute(
             select(ChatSession)
+            .options(selectinload(ChatSession.message_rows))
             .where(
                 ChatSession.user_id == user_id,
                 ChatSession.trip_id == trip_id
@@ -2773,11 +2914,14 @@ action_type은 가장 대표적인 액션 하나를 쓰되, "compound"를 써도
 
 # 싱글톤 인스턴스
 _chat_service_instance = None
+_chat_service_lock = threading.Lock()
 
 
 def get_chat_service() -> ChatService:
-    """싱글톤 채팅 서비스 반환"""
+    """싱글톤 채팅 서비스 반환 (동시 첫 호출에도 클라이언트는 하나만 생성)"""
     global _chat_service_instance
     if _chat_service_instance is None:
-        _chat_service_instance = ChatService()
+        with _chat_service_lock:
+            if _chat_service_instance is None:
+                _chat_service_instance = ChatService()
     return _chat_service_instance
@@ -105,3 +105,4 @@ GPT_VISION_MAX_TOKENS = 800     # 사진 분석 응답
 # ---------------------------------------------------------------------------
 CHAT_CONTEXT_LIMIT = 10   # GPT에 전달하는 최근 메시지 수 (토큰 절약)
 CHAT_STORAGE_LIMIT = 20   # DB에 저장하는 최대 메시지 수
+CHAT_CONTEXT_CHAR_BUDGET = 4000  # GPT에 전달하는 히스토리 총 글자 수 상한 (변경결과 JSON이 긴 턴이 많아도 프롬프트 크기 고정)
@@ -3,6 +3,7 @@ import traceback
 from datetime import date
 from typing import List, Optional
 from fastapi import APIRouter, Depends, Form, File, HTTPException, UploadFile, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import provide_session
@@ -493,7 +494,8 @@ async def generate_with_photo_upload(
 
 # ==================== 대화형 수정 API ====================
 
-@router.post("/chat", response_model=ChatResponse)
+# 응답에 수정된 여행 전체(updated_trip)가 실리므로 orjson으로 직렬화
+@router.post("/chat", response_model=ChatResponse, response_class=ORJSONResponse)
 async def chat_modify(
     request: ChatRequest,
     current_user: User = Depends(get_current_user),
@@ -523,7 +525,7 @@ async def chat_modify(
 
     try:
         result = await chat_service.process_message(
-            db, current_user.id, request
+            db, current_user.id, request, trip=trip
         )
         return result
     except Exception as e:
@@ -1,14 +1,13 @@
 import json
 import re
 import logging
-import asyncio
 from typing import List, Optional, Dict
 from datetime import time, timedelta
-from openai import OpenAI
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.config import get_config
+from services.openai_service import get_openai_client
 from core.models import UserPreference, Place
 from Trip.dto import TripCreate
 from Trip import crud as trip_crud
@@ -30,7 +29,7 @@ class PlannerService:
 
     def __init__(self):
         config = get_config()
-        self.client = OpenAI(api_key=config.openai_api_key)
+        self.client = get_openai_client()
         self.model = config.openai_model
         self.recommender = get_condition_recommender()
         self.route_optimizer = get_route_optimizer()
@@ -345,8 +344,8 @@ class PlannerService:
         place_dict = {c['place_id']: c for c in candidates}
         current_prompt = prompt
 
-        def _call_gpt(p: str):
-            return self.client.chat.completions.create(
+        async def _call_gpt(p: str):
+            return await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -361,7 +360,7 @@ class PlannerService:
 
         last_error = None
         for attempt in range(3):
-            response = await asyncio.to_thread(_call_gpt, current_prompt)
+            response = await _call_gpt(current_prompt)
             result_text = response.choices[0].message.content
             try:
                 draft = self._parse_gpt_response(result_text)
@@ -1,17 +1,15 @@
-import asyncio
 import base64
 import json
 import logging
-from openai import OpenAI
 from typing import Optional
 from core.config import get_config
+from services.openai_service import get_openai_client
 from Vision.dto import VisionAnalysisResult, LocationInfo, SceneInfo, VisionResponse, ExifInfo, LocationCandidate
 from Planner.constants import GPT_VISION_MAX_TOKENS
 
 logger = logging.getLogger(__name__)
 
 config = get_config()
-client = OpenAI(api_key=config.openai_api_key)
 
 
 VISION_PROMPT = """이 앱은 대한민국 국내 여행 전용 앱입니다. 사진을 단계적으로 분석해줘.
@@ -142,28 +140,25 @@ async def analyze_image_with_gpt(image_path: str) -> VisionAnalysisResult:
     media_type = "image/jpeg" if ext in ["jpg", "jpeg"] else f"image/{ext}"
 
     try:
-        def _call_gpt():
-            return client.chat.completions.create(
-                model=config.openai_model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": VISION_PROMPT},
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": f"data:{media_type};base64,{base64_image}",
-                                    "detail": "high"
-                                }
+        response = await get_openai_client().chat.completions.create(
+            model=config.openai_model,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": VISION_PROMPT},
+                        {
+                            "type": "image_url",
+                            "image_url": {
+                                "url": f"data:{media_type};base64,{base64_image}",
+                                "detail": "high"
                             }
-                        ]
-                    }
-                ],
-                max_tokens=GPT_VISION_MAX_TOKENS
-            )
-
-        response = await asyncio.to_thread(_call_gpt)
+                        }
+                    ]
+                }
+            ],
+            max_tokens=GPT_VISION_MAX_TOKENS
+        )
 
         result_text = response.choices[0].message.content
 
@@ -0,0 +1,34 @@
+"""Add partial index on festival places by event dates
+
+Revision ID: f6g7h8i9j0k1
+Revises: e5f6g7h8i9j0
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6g7h8i9j0k1'
+down_revision: Union[str, Sequence[str], None] = 'e5f6g7h8i9j0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """축제 Place 기간 범위 조회용 부분 복합 인덱스"""
+    op.create_index(
+        'ix_places_festival_dates',
+        'places',
+        ['event_start_date', 'event_end_date'],
+        unique=False,
+        postgresql_where=sa.text('is_festival = true')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_places_festival_dates', table_name='places')
@@ -0,0 +1,44 @@
+"""Add trigram GIN indexes on place name and address
+
+Revision ID: g7h8i9j0k1l2
+Revises: f6g7h8i9j0k1
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'g7h8i9j0k1l2'
+down_revision: Union[str, Sequence[str], None] = 'f6g7h8i9j0k1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """장소 이름/주소 부분 일치(LIKE '%kw%') 검색용 pg_trgm GIN 인덱스"""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_places_name_trgm',
+        'places',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_places_address_trgm',
+        'places',
+        ['address'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'address': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_places_address_trgm', table_name='places')
+    op.drop_index('ix_places_name_trgm', table_name='places')
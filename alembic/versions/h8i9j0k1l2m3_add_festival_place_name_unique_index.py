@@ -0,0 +1,60 @@
+"""Add partial unique index on festival place names
+
+Revision ID: h8i9j0k1l2m3
+Revises: g7h8i9j0k1l2
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'h8i9j0k1l2m3'
+down_revision: Union[str, Sequence[str], None] = 'g7h8i9j0k1l2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 같은 이름 축제 Place 중 남길 행(가장 작은 id) 매핑
+_FESTIVAL_DUPLICATES = """
+    SELECT id, MIN(id) OVER (PARTITION BY name) AS keep_id
+    FROM places
+    WHERE is_festival = true
+"""
+
+
+def upgrade() -> None:
+    """축제 Place 이름 부분 유니크 인덱스 (INSERT ... ON CONFLICT 대상)"""
+    # 기존 select-then-insert 경합으로 생긴 중복 축제 Place 정리 (없으면 인덱스 생성 실패)
+    # 참조(일정·분석 로그)를 이름별 가장 작은 id로 옮긴 뒤 나머지 행 삭제
+    op.execute(f"""
+        UPDATE itineraries i SET place_id = d.keep_id
+        FROM ({_FESTIVAL_DUPLICATES}) d
+        WHERE i.place_id = d.id AND d.id <> d.keep_id
+    """)
+    op.execute(f"""
+        UPDATE analysis_logs a SET selected_place_id = d.keep_id
+        FROM ({_FESTIVAL_DUPLICATES}) d
+        WHERE a.selected_place_id = d.id AND d.id <> d.keep_id
+    """)
+    op.execute(f"""
+        DELETE FROM places p
+        USING ({_FESTIVAL_DUPLICATES}) d
+        WHERE p.id = d.id AND d.id <> d.keep_id
+    """)
+
+    op.create_index(
+        'uq_places_festival_name',
+        'places',
+        ['name'],
+        unique=True,
+        postgresql_where=sa.text('is_festival = true')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_places_festival_name', table_name='places')
@@ -0,0 +1,32 @@
+"""Add category + readcount index on places
+
+Revision ID: i9j0k1l2m3n4
+Revises: h8i9j0k1l2m3
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'i9j0k1l2m3n4'
+down_revision: Union[str, Sequence[str], None] = 'h8i9j0k1l2m3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """카테고리별 인기순 상위 N개 조회용 복합 인덱스"""
+    op.create_index(
+        'ix_places_category_readcount',
+        'places',
+        ['category', sa.text('readcount DESC NULLS LAST')]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_places_category_readcount', table_name='places')
@@ -0,0 +1,65 @@
+"""Move chat session messages from JSON column to chat_session_messages table
+
+Revision ID: j0k1l2m3n4o5
+Revises: i9j0k1l2m3n4
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'j0k1l2m3n4o5'
+down_revision: Union[str, Sequence[str], None] = 'i9j0k1l2m3n4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """메시지 테이블 생성 → 기존 JSON 히스토리 이관 → messages 컬럼 제거"""
+    op.create_table('chat_session_messages',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('session_id', sa.Integer(), nullable=False),
+        sa.Column('seq', sa.Integer(), nullable=False),
+        sa.Column('role', sa.String(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['session_id'], ['chat_sessions.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_chat_session_messages_session_seq',
+        'chat_session_messages',
+        ['session_id', 'seq']
+    )
+
+    op.execute("""
+        INSERT INTO chat_session_messages (session_id, seq, role, content)
+        SELECT s.id, e.ord, e.msg->>'role', COALESCE(e.msg->>'content', '')
+        FROM chat_sessions s,
+             json_array_elements(s.messages) WITH ORDINALITY AS e(msg, ord)
+        WHERE s.messages IS NOT NULL AND json_typeof(s.messages) = 'array'
+    """)
+
+    op.drop_column('chat_sessions', 'messages')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('chat_sessions', sa.Column('messages', sa.JSON(), nullable=True))
+    op.execute("""
+        UPDATE chat_sessions s
+        SET messages = m.messages
+        FROM (
+            SELECT session_id,
+                   json_agg(json_build_object('role', role, 'content', content) ORDER BY seq) AS messages
+            FROM chat_session_messages
+            GROUP BY session_id
+        ) m
+        WHERE s.id = m.session_id
+    """)
+    op.drop_index('ix_chat_session_messages_session_seq', table_name='chat_session_messages')
+    op.drop_table('chat_session_messages')
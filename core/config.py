@@ -15,11 +15,17 @@ class Settings(BaseSettings):
 
     base_url: str = "http://43.200.169.98:8000"
 
+    # 루트 로거 레벨 (DEBUG, INFO, WARNING ...)
+    log_level: str = "INFO"
+
     openai_api_key: str = ""
     openai_model: str = "gpt-4o"
     kakao_map_api_key: str = ""
     kakao_rest_api_key: str
     tour_api_key: str = ""
+    # TourAPI 요청 속도 제한 (data.go.kr 기본 트래픽 초당 30건, 축제 검색 상세 조회 ~100건은 버스트로 바로 처리)
+    tour_api_rate_per_sec: float = 30
+    tour_api_burst: int = 100
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Float, JSON, Date, Time, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Float, JSON, Date, Time, UniqueConstraint, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from core.database import Base
@@ -58,6 +58,30 @@ class Place(Base):
     event_start_date = Column(String, nullable=True) # YYYYMMDD
     event_end_date = Column(String, nullable=True)   # YYYYMMDD
 
+    __table_args__ = (
+        # 축제 Place 기간 범위 조회용 (is_festival = true 행만 인덱싱)
+        Index(
+            "ix_places_festival_dates", "event_start_date", "event_end_date",
+            postgresql_where=text("is_festival = true")
+        ),
+        # 축제 Place 이름 중복 방지 (save_festival_as_place의 ON CONFLICT 대상)
+        Index(
+            "uq_places_festival_name", "name",
+            unique=True, postgresql_where=text("is_festival = true")
+        ),
+        # 이름/주소 부분 일치 검색(contains → LIKE '%kw%')용 trigram 인덱스 (pg_trgm 필요)
+        Index(
+            "ix_places_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_places_address_trgm", "address",
+            postgresql_using="gin", postgresql_ops={"address": "gin_trgm_ops"}
+        ),
+        # 카테고리별 인기순 조회(category = ? ORDER BY readcount DESC NULLS LAST LIMIT n)용
+        Index("ix_places_category_readcount", "category", text("readcount DESC NULLS LAST")),
+    )
+
 # 3. Photo Analysis Domain (사진 분석 & 로그)
 class AnalysisLog(Base):
     __tablename__ = "analysis_logs"
@@ -114,7 +138,13 @@ class Trip(Base):
 
     # 관계 설정
     user = relationship("User", back_populates="trips")
-    itineraries = relationship("Itinerary", back_populates="trip", cascade="all, delete-orphan")
+    # 일차 → 순서대로 로드 (조회 쪽에서 매번 다시 정렬하지 않도록)
+    itineraries = relationship(
+        "Itinerary",
+        back_populates="trip",
+        cascade="all, delete-orphan",
+        order_by="(Itinerary.day_number, Itinerary.order_index)",
+    )
 
 
 class Itinerary(Base):
@@ -183,9 +213,6 @@ class ChatSession(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     trip_id = Column(Integer, ForeignKey("trips.id"), nullable=True)
 
-    # 대화 히스토리 (GPT 컨텍스트 유지용)
-    messages = Column(JSON, nullable=True)            # [{"role": "user/assistant", "content": "..."}]
-
     # 현재 작업 상태
     current_state = Column(String, nullable=True)     # "gathering", "generating", "modifying"
 
@@ -195,6 +222,41 @@ class ChatSession(Base):
     # 관계 설정
     user = relationship("User", back_populates="chat_sessions")
     trip = relationship("Trip")
+    # 대화 히스토리 (GPT 컨텍스트 유지용, 턴마다 새 행만 INSERT)
+    # 조회 시 selectinload 필요, 세션 삭제 시 행은 DB FK CASCADE로 삭제
+    message_rows = relationship(
+        "ChatSessionMessage",
+        back_populates="session",
+        order_by="ChatSessionMessage.seq",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
+    @property
+    def messages(self) -> list:
+        """[{"role": "user/assistant", "content": "..."}] 형태의 히스토리 (오래된 순)"""
+        return [{"role": m.role, "content": m.content} for m in self.message_rows]
+
+
+class ChatSessionMessage(Base):
+    """채팅 세션의 메시지 한 건"""
+    __tablename__ = "chat_session_messages"
+
+    id = Column(Integer, primary_key=True)
+    session_id = Column(Integer, ForeignKey("chat_sessions.id", ondelete="CASCADE"), nullable=False)
+    seq = Column(Integer, nullable=False)              # 세션 내 순번 (1부터 증가)
+    role = Column(String, nullable=False)              # "user" / "assistant"
+    content = Column(Text, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # 관계 설정
+    session = relationship("ChatSession", back_populates="message_rows")
+
+    __table_args__ = (
+        # 세션별 최근 메시지 조회 / 오래된 메시지 정리용
+        Index("ix_chat_session_messages_session_seq", "session_id", "seq"),
+    )
 
 
 # 7. Board Domain (여행 후기 게시판)
@@ -1,5 +1,7 @@
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,6 +10,10 @@ from contextlib import asynccontextmanager
 
 from core.config import get_config
 from core.database import init_db
+from DataCollector.wikipedia_service import get_wikipedia_service
+from DataCollector.tour_api_service import close_tour_api_service
+from services.openai_service import close_openai_client, warm_up_openai_client
+from Planner.chat_service import get_chat_service
 
 # 라우터 임포트
 from User.user_router import router as user_router
@@ -23,13 +29,38 @@ from Board.router import router as board_router
 logger = logging.getLogger(__name__)
 
 
+def setup_queue_logging(level: str = "INFO") -> QueueListener:
+    """루트 로거 출력을 큐로 넘겨 별도 스레드에서 기록 (이벤트 루프에서 stderr 쓰기 방지)"""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    root = logging.getLogger()
+    # 기본 WARNING이면 모듈 로거의 info/debug가 모두 버려지므로 설정값으로 지정
+    root.setLevel(level.upper())
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     config = get_config()
+    log_listener = setup_queue_logging(config.log_level)
     init_db(config)
+    # 채팅 서비스와 OpenAI 커넥션 풀을 시작 시 준비 → 첫 채팅 요청에서 생성·TLS 비용 제거
+    get_chat_service()
+    await warm_up_openai_client()
     logger.info("서버 시작. 데이터 수집은 /data/collect/bulk API를 통해 수동으로 실행하세요.")
     yield
+    wiki_service = get_wikipedia_service()
+    wiki_service.save_miss_cache()
+    await wiki_service.close()
+    await close_tour_api_service()
+    await close_openai_client()
     logger.info("서버 종료")
+    log_listener.stop()
 
 
 # 라우터 리스트
@@ -0,0 +1,48 @@
+# services/openai_service.py
+import asyncio
+import logging
+import threading
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from core.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# 채팅/일정 생성/사진 분석이 하나의 비동기 클라이언트와 커넥션 풀을 공유
+# (HTTP/2 멀티플렉싱 + keep-alive로 요청마다 TLS 핸드셰이크 제거, 스레드 풀 미사용)
+# 풀이 가득 차면 새 요청은 연결이 빌 때까지 대기 → 동시 GPT 호출 수 상한 역할도 겸함
+_client: Optional[AsyncOpenAI] = None
+_client_lock = threading.Lock()
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """공유 AsyncOpenAI 클라이언트 반환 (최초 호출 시 생성)"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = AsyncOpenAI(
+                    api_key=get_config().openai_api_key,
+                    http_client=DefaultAsyncHttpxClient(
+                        http2=True,
+                        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    ),
+                )
+    return _client
+
+
+async def warm_up_openai_client(timeout: float = 5.0) -> None:
+    """앱 시작 시 가벼운 요청(models.list)으로 TLS/HTTP2 연결을 미리 열어둠 (실패해도 시작은 계속)"""
+    try:
+        await asyncio.wait_for(get_openai_client().models.list(), timeout)
+    except Exception as e:
+        logger.warning(f"OpenAI 연결 예열 실패 (첫 요청에서 연결): {e}")
+
+
+async def close_openai_client() -> None:
+    """앱 종료 시 공유 클라이언트(커넥션 풀) 정리"""
+    if _client is not None:
+        await _client.close()